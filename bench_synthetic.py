@@ -0,0 +1,84 @@
+# bench_synthetic.py
+
+import argparse
+import os
+import tempfile
+import time
+
+from consumers import SQLiteWriter, stream_rows
+from pdf_parser import PDFTableParser
+from row_merger import RowMerger
+from sqlite_repository import SQLiteCauseListRepository
+from synthetic import SyntheticCauseList
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def bench(pages, seed, with_db=True):
+    doc = SyntheticCauseList(pages=pages, seed=seed)
+
+    # pages are generated lazily so 10k+ page runs fit in memory; the
+    # generator's own cost is measured separately and subtracted
+    _, gen_s = timed(lambda: sum(1 for _ in doc))
+    rows, parse_s = timed(PDFTableParser().parse_pages, doc)
+    merged, merge_s = timed(RowMerger().merge, rows)
+
+    db_s = stream_s = 0.0
+    if with_db and merged:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = SQLiteCauseListRepository(os.path.join(tmp, "bench.db"))
+            repo.prepare_tables(merged[0][7])
+            _, db_s = timed(repo.insert, merged)
+
+            # parse, merge and insert again with the writer thread overlapping them
+            writer = SQLiteWriter(SQLiteCauseListRepository(os.path.join(tmp, "stream.db")))
+            _, stream_s = timed(stream_rows, PDFTableParser(), [writer], doc)
+
+    return {
+        "pages": pages,
+        "rows": len(rows),
+        "cases": len(merged),
+        "parse": max(parse_s - gen_s, 0.0),
+        "merge": merge_s,
+        "db": db_s,
+        # end to end, so compare against parse + merge + db
+        "stream": max(stream_s - gen_s, 0.0),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Scaling benchmark on synthetic cause lists")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 5000, 10000])
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--no-db", action="store_true", help="skip the SQLite insert stage")
+    args = ap.parse_args()
+
+    results = [bench(n, args.seed, not args.no_db) for n in sorted(args.sizes)]
+
+    print(f"{'pages':>7} {'rows':>8} {'cases':>7} "
+          f"{'parse us/pg':>12} {'merge us/pg':>12} {'db us/pg':>10} {'stream us/pg':>13}")
+    for r in results:
+        print(
+            f"{r['pages']:>7} {r['rows']:>8} {r['cases']:>7} "
+            f"{r['parse'] / r['pages'] * 1e6:>12.1f} "
+            f"{r['merge'] / r['pages'] * 1e6:>12.1f} "
+            f"{r['db'] / r['pages'] * 1e6:>10.1f} "
+            f"{r['stream'] / r['pages'] * 1e6:>13.1f}"
+        )
+
+    # per-page cost should stay flat; growth across sizes means superlinear work
+    first, last = results[0], results[-1]
+    for stage in ("parse", "merge", "db", "stream"):
+        if not first[stage]:
+            continue
+        growth = (last[stage] / last["pages"]) / (first[stage] / first["pages"])
+        flag = "  <-- superlinear?" if growth > 1.5 else ""
+        print(f"{stage}: per-page cost x{growth:.2f} from {first['pages']} to {last['pages']} pages{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# case_number.py
+
+import re
+
+
+DIARY_RE = re.compile(
+    r"DIARY\s+NO\.?\s*[-:]?\s*(?P<number>\d+)\s*-\s*(?P<year>\d{4})",
+    re.IGNORECASE
+)
+
+CASE_RE = re.compile(
+    r"^(?:CONNECTED\s+)?"
+    r"(?P<type>[A-Z][A-Z.()\s]*?)??\s*"
+    r"(?:NO\.?\s*[-:]?\s*(?:D\s*-?\s*)?|-)?"
+    r"(?P<number>\d+)\s*(?:-\s*(?P<number_to>\d*)\s*)?/\s*(?P<year>\d{4})",
+    re.IGNORECASE
+)
+
+SECTION_RE = re.compile(r"(?<![\w.(])(PIL-W|[IVX]+(?:\s*-\s*[A-Z])?)(?![\w.)])")
+
+IA_RE = re.compile(r"\bIA\s*(?:NO\.?\s*)?(\d+)\s*/\s*(\d{4})", re.IGNORECASE)
+
+
+# spelled-out forms -> the abbreviation cause lists print; keys and values
+# are already in normalize_case_type's dot- and space-free form
+TYPE_ALIASES = {
+    "CIVILAPPEAL": "CA",
+    "CRIMINALAPPEAL": "CRLA",
+    "SPECIALLEAVEPETITION(C)": "SLP(C)",
+    "SPECIALLEAVEPETITION(CRL)": "SLP(CRL)",
+    "WRITPETITION(C)": "WP(C)",
+    "WRITPETITION(CRL)": "WP(CRL)",
+    "TRANSFERPETITION(C)": "TP(C)",
+    "TRANSFERPETITION(CRL)": "TP(CRL)",
+    "TRANSFERCASE(C)": "TC(C)",
+    "CONTEMPTPETITION(C)": "CONMTPET(C)",
+    "MISCELLANEOUSAPPLICATION": "MA",
+}
+
+
+def normalize_case_type(text):
+    """
+    Canonical case type, used both when storing and when querying:
+    upper-case without dots or spaces ("SLP(Crl.)" -> "SLP(CRL)",
+    "C.A." -> "CA"), with spelled-out names mapped to their abbreviation.
+    """
+    if not text:
+        return None
+    text = re.sub(r"[\s.]+", "", text).upper()
+    text = text.replace("(CIVIL)", "(C)").replace("(CRIMINAL)", "(CRL)")
+    if text == "CONNECTED":
+        return None
+    return TYPE_ALIASES.get(text, text) or None
+
+
+def parse_case_no(text):
+    """
+    Split a CASE NO. cell such as "SLP(Crl) No. 13836-13842/2024 II-A"
+    into case_type, number, number_to, year and section.
+
+    Returns None when no case number can be found.
+    """
+    if not text:
+        return None
+
+    text = text.strip()
+    match = DIARY_RE.search(text)
+
+    if match:
+        case_type, number_to = "DIARY", None
+    else:
+        match = CASE_RE.search(text)
+        if not match:
+            return None
+        case_type = normalize_case_type(match.group("type"))
+        number_to = match.group("number_to") or None
+
+    section = SECTION_RE.search(text, match.end())
+
+    return {
+        "case_type": case_type,
+        "number": int(match.group("number")),
+        "number_to": int(number_to) if number_to else None,
+        "year": int(match.group("year")),
+        "section": re.sub(r"\s+", "", section.group(1)) if section else None,
+    }
+
+
+def parse_ia_numbers(text):
+    """Return the distinct (ia_no, ia_year) pairs mentioned in text, in order."""
+    if not text:
+        return []
+
+    seen = []
+    for number, year in IA_RE.findall(text):
+        pair = (int(number), int(year))
+        if pair not in seen:
+            seen.append(pair)
+    return seen
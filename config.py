@@ -2,6 +2,19 @@
 
 FILE_PATH = "cause_list20251230.pdf"
 DB_PATH = "cause_list.db"
+LAYOUT_CACHE_PATH = "layout_templates.json"
+CSV_PATH = "cause_list_results.csv"
+
+# streaming pipeline: rows per SQLite commit, and pages of rows each
+# writer thread may fall behind the parser before it blocks
+WRITER_BATCH_SIZE = 2000
+WRITER_QUEUE_SIZE = 64
+
+# CSV backfill: rows per transaction, rows per batch handed from a
+# reader thread to the writer, and batches each file may be read ahead
+IMPORT_BATCH_SIZE = 50000
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_READ_AHEAD = 8
 
 HEADER_GRAY = (0.8, 0.8, 0.8)
 WHITE = (1.0, 1.0, 1.0)
@@ -13,4 +26,6 @@ HEADERS = [
     "Petitioner / Respondent ADVOCATE"
 ]
 
+METADATA_HEADERS = ["Judges", "Court No", "Court", "Date", "Page No"]
+
 TABLE_END_X_TOLERANCE = 15
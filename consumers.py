@@ -0,0 +1,239 @@
+# consumers.py
+
+import csv
+import os
+import queue
+import sqlite3
+import threading
+from itertools import groupby
+
+from config import (
+    CSV_PATH, HEADERS, METADATA_HEADERS, WRITER_BATCH_SIZE, WRITER_QUEUE_SIZE
+)
+from row_merger import RowMerger
+
+
+_DONE = object()
+_FAILED = object()
+
+
+class QueueConsumer(threading.Thread):
+    """
+    Thread draining a bounded queue of merged-row batches.
+
+    put() blocks while the queue is full, so the parser never runs more
+    than queue_size batches ahead of a slow writer. Subclasses implement
+    consume/finish/abort, which all run on the consumer thread.
+    """
+
+    def __init__(self, queue_size=WRITER_QUEUE_SIZE):
+        super().__init__(daemon=True)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.rows = 0
+
+    def put(self, rows):
+        if self.error:
+            raise self.error
+        if rows:
+            self.queue.put(rows)
+
+    def close(self, failed=False):
+        """Wait for queued rows to be written; failed=True discards them instead."""
+        self.queue.put(_FAILED if failed else _DONE)
+        self.join()
+        if self.error and not failed:
+            raise self.error
+
+    def run(self):
+        item = None
+        try:
+            while item not in (_DONE, _FAILED):
+                item = self.queue.get()
+                if item is _DONE:
+                    self.finish()
+                elif item is _FAILED:
+                    self.abort()
+                else:
+                    self.consume(item)
+                    self.rows += len(item)
+        except BaseException as e:
+            self.error = e
+            if item is not _FAILED:
+                self.abort()
+        finally:
+            # keep draining so a producer blocked on a full queue reaches close()
+            while item not in (_DONE, _FAILED):
+                item = self.queue.get()
+
+    def consume(self, rows):
+        raise NotImplementedError
+
+    def finish(self):
+        pass
+
+    def abort(self):
+        pass
+
+
+class SQLiteWriter(QueueConsumer):
+    """
+    Owns one SQLite connection and commits every batch_size rows. Each
+    date gets a staging copy, prepared once per writer when its first rows
+    arrive, so batches may mix dates.
+
+    Batches are committed to the staging copies only; finish() swaps every
+    date in within one transaction, so readers keep seeing the previously
+    stored lists until then and never a partial one. On failure the open
+    transaction is rolled back and the staging copies are dropped, leaving
+    the stored lists as they were.
+    """
+
+    def __init__(self, repo, batch_size=WRITER_BATCH_SIZE, queue_size=WRITER_QUEUE_SIZE):
+        super().__init__(queue_size)
+        self.repo = repo
+        self.batch_size = batch_size
+        self.conn = None
+        # date suffix -> date as first seen, for every date prepared so far
+        self.dates = {}
+        self.pending = {}
+        self.pending_rows = 0
+        self.commits = 0
+
+    def consume(self, rows):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.repo.db_path)
+
+        for date, group in groupby(rows, key=lambda r: r[7]):
+            suffix = self.repo._date_suffix(date)
+            if suffix not in self.dates:
+                self.repo.prepare_tables(date, self.conn.cursor(), staging=True)
+                self.dates[suffix] = date
+
+            group = list(group)
+            self.pending.setdefault(suffix, []).extend(group)
+            self.pending_rows += len(group)
+
+        if self.pending_rows >= self.batch_size:
+            self._commit()
+
+    def _commit(self):
+        cur = self.conn.cursor()
+        for rows in self.pending.values():
+            self.repo.write_batch(cur, rows, staging=True)
+        self.conn.commit()
+
+        self.pending = {}
+        self.pending_rows = 0
+        self.commits += 1
+
+    def finish(self):
+        if self.conn is None:
+            return
+        if self.pending:
+            self._commit()
+
+        cur = self.conn.cursor()
+        cur.execute("BEGIN")
+        for date in self.dates.values():
+            self.repo.publish_staged(date, cur)
+        self.conn.commit()
+        self.conn.close()
+        self.conn = None
+
+    def abort(self):
+        if self.conn is None:
+            return
+        self.conn.rollback()
+        self.conn.close()
+        self.conn = None
+        self.repo.forget_ids()
+        for date in self.dates.values():
+            self.repo.discard_staged(date)
+
+
+class CSVWriter(QueueConsumer):
+    """Writes the export_csv layout to a temporary file, renamed into place on success."""
+
+    def __init__(self, path=CSV_PATH, queue_size=WRITER_QUEUE_SIZE):
+        super().__init__(queue_size)
+        self.path = path
+        self.tmp = f"{path}.tmp"
+        self.file = None
+        self.writer = None
+
+    def consume(self, rows):
+        if self.file is None:
+            self._open()
+        self.writer.writerows(rows)
+
+    def _open(self):
+        self.file = open(self.tmp, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(HEADERS + METADATA_HEADERS)
+
+    def finish(self):
+        if self.file is None:
+            self._open()
+        self.file.close()
+        os.replace(self.tmp, self.path)
+
+    def abort(self):
+        if self.file is None:
+            return
+        self.file.close()
+        os.remove(self.tmp)
+
+
+def stream_rows(parser, consumers, pages=None):
+    """
+    Run parser while merging each finished page's rows and handing the
+    cases it closes to every consumer, so writing overlaps parsing.
+    With pages (extract_page dicts) given, parses those instead of the
+    parser's source.
+
+    Returns the parsed (unmerged) rows, like parser.run().
+    """
+    merger = RowMerger()
+    flushed = 0
+    current = None
+
+    def flush():
+        nonlocal flushed, current
+        rows = parser.extracted_rows[flushed:]
+        flushed = len(parser.extracted_rows)
+
+        closed, current = merger.merge_open(rows, current)
+        for consumer in consumers:
+            consumer.put(closed)
+
+    for consumer in consumers:
+        consumer.start()
+
+    try:
+        # on_page fires before each page is processed, so it hands over
+        # the rows of the pages before it
+        on_page = lambda page_no, page: flush()
+        if pages is None:
+            parser.run(on_page=on_page)
+        else:
+            parser.parse_pages(pages, on_page=on_page)
+        flush()
+        if current:
+            for consumer in consumers:
+                consumer.put([current])
+    except BaseException:
+        for consumer in consumers:
+            consumer.close(failed=True)
+        raise
+
+    # consumers finish in order, so a failed database write leaves no CSV
+    for i, consumer in enumerate(consumers):
+        try:
+            consumer.close()
+        except BaseException:
+            for rest in consumers[i + 1:]:
+                rest.close(failed=True)
+            raise
+
+    return parser.extracted_rows
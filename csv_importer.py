@@ -0,0 +1,188 @@
+# csv_importer.py
+
+import argparse
+import csv
+import glob
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import (
+    DB_PATH, HEADERS, METADATA_HEADERS, IMPORT_BATCH_SIZE, IMPORT_CHUNK_SIZE,
+    IMPORT_READ_AHEAD
+)
+from consumers import SQLiteWriter
+from sqlite_repository import SQLiteCauseListRepository
+
+
+COLUMNS = HEADERS + METADATA_HEADERS
+COURT_NO_INDEX = COLUMNS.index("Court No")
+COURT_INDEX = COLUMNS.index("Court")
+DATE_INDEX = COLUMNS.index("Date")
+
+_END = object()
+
+
+def read_rows(path, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Stream a CSV in the export_csv layout as lists of rows shaped like
+    the pipeline's merged rows.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+
+        header = next(reader, None)
+        if header != COLUMNS:
+            raise ValueError(f"{path}: unexpected header {header}, expected {COLUMNS}")
+
+        chunk = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != len(COLUMNS):
+                raise ValueError(
+                    f"{path}:{reader.line_num}: {len(row)} columns, expected {len(COLUMNS)}"
+                )
+            if not row[DATE_INDEX]:
+                raise ValueError(f"{path}:{reader.line_num}: missing Date")
+
+            # export_csv writes the parser's None as an empty field
+            row[COURT_NO_INDEX] = row[COURT_NO_INDEX] or None
+            row[COURT_INDEX] = row[COURT_INDEX] or None
+
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+
+class CSVImporter:
+    """
+    Loads exported cause-list CSVs through the same repository path as
+    live ingestion: rows are partitioned by their Date column, each date
+    is replaced once per run, and judges resolve to the shared benches.
+
+    Files are read on up to `workers` threads, each at most read_ahead
+    chunks ahead, but chunks reach the one SQLiteWriter strictly in path
+    order: only the file at the head of the list is streamed while later
+    ones are read ahead. A date found in two files is an error; it is
+    raised before the offending chunk is queued, the writer discards its
+    staged rows and the database is left unchanged.
+    """
+
+    def __init__(self, db_path, workers=4, batch_size=IMPORT_BATCH_SIZE,
+                 chunk_size=IMPORT_CHUNK_SIZE, read_ahead=IMPORT_READ_AHEAD):
+        self.db_path = db_path
+        self.workers = workers
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.read_ahead = read_ahead
+
+    def run(self, paths):
+        repo = SQLiteCauseListRepository(self.db_path)
+        writer = SQLiteWriter(repo, self.batch_size)
+        writer.start()
+        start = time.perf_counter()
+
+        counts = {}
+        # date suffix -> (position, path) of the file it came from
+        sources = {}
+        stop = threading.Event()
+
+        try:
+            with ThreadPoolExecutor(self.workers) as pool:
+                try:
+                    # the pool starts files in path order, so the head file
+                    # is always being read or already read
+                    reads = []
+                    for path in paths:
+                        chunks = queue.Queue(maxsize=self.read_ahead)
+                        pool.submit(self._read, path, chunks, stop)
+                        reads.append((path, chunks))
+
+                    for position, (path, chunks) in enumerate(reads):
+                        counts[path] = 0
+                        for rows in self._drain(chunks):
+                            for date in {r[DATE_INDEX] for r in rows}:
+                                source = sources.setdefault(repo._date_suffix(date), (position, path))
+                                if source[0] != position:
+                                    raise ValueError(f"{path}: date {date} is also in {source[1]}")
+                            writer.put(rows)
+                            counts[path] += len(rows)
+                finally:
+                    # unblock readers still waiting on a full queue
+                    stop.set()
+        except BaseException:
+            writer.close(failed=True)
+            raise
+        writer.close()
+
+        seconds = time.perf_counter() - start
+        rows = sum(counts.values())
+        return {
+            "files": counts,
+            "dates": sorted(writer.dates.values()),
+            "rows": rows,
+            "commits": writer.commits,
+            "seconds": seconds,
+            "rows_per_sec": rows / seconds if seconds else 0.0,
+        }
+
+    def _read(self, path, chunks, stop):
+        """Reader thread: queue the file's chunks, then _END or the error raised."""
+        try:
+            for rows in read_rows(path, self.chunk_size):
+                if not self._offer(chunks, rows, stop):
+                    return
+            item = _END
+        except BaseException as e:
+            item = e
+        self._offer(chunks, item, stop)
+
+    @staticmethod
+    def _offer(chunks, item, stop):
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    @staticmethod
+    def _drain(chunks):
+        while True:
+            item = chunks.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Backfill the database from exported cause-list CSVs")
+    ap.add_argument("csv", nargs="+", help="CSV files or glob patterns")
+    ap.add_argument("--db", default=DB_PATH)
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = ap.parse_args()
+
+    paths = sorted({p for pattern in args.csv for p in glob.glob(pattern) or [pattern]})
+    stats = CSVImporter(args.db, args.workers, args.batch_size).run(paths)
+
+    for path, count in stats["files"].items():
+        print(f"{path}: {count} rows")
+    print(
+        f"{stats['rows']} rows for {len(stats['dates'])} date(s) in "
+        f"{stats['seconds']:.2f}s ({stats['rows_per_sec']:.0f} rows/sec, "
+        f"{stats['commits']} commit(s))"
+    )
+
+
+if __name__ == "__main__":
+    main()
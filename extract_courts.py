@@ -0,0 +1,45 @@
+# extract_courts.py
+
+import argparse
+import csv
+import time
+
+from config import HEADERS, METADATA_HEADERS
+from page_scan import PAGE_SKIP
+from pdf_parser import PDFTableParser
+from pdf_source import PDFSource
+from row_merger import RowMerger
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Extract only the cases listed in some courtrooms or before some judges"
+    )
+    ap.add_argument("pdf")
+    ap.add_argument("--courts", nargs="*", default=None, help="court numbers, e.g. 10 12")
+    ap.add_argument("--judges", nargs="*", default=None, help="whole words of the names, dots and spacing ignored, e.g. 'SANDEEP MEHTA' or 'J.K. MAHESHWARI'")
+    ap.add_argument("--csv", default="cause_list_selected.csv")
+    args = ap.parse_args()
+
+    if not args.courts and not args.judges:
+        ap.error("give --courts and/or --judges")
+
+    start = time.perf_counter()
+    with PDFSource(args.pdf) as source:
+        parser = PDFTableParser(source, courts=args.courts, judges=args.judges)
+        rows = RowMerger().merge(parser.run())
+
+    with open(args.csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS + METADATA_HEADERS)
+        writer.writerows(rows)
+
+    skipped = sum(1 for kind in parser.page_kinds.values() if kind == PAGE_SKIP)
+    print(
+        f"{len(rows)} cases from {len(parser.page_kinds)} pages "
+        f"({skipped} skipped) in {time.perf_counter() - start:.2f}s -> {args.csv}"
+    )
+
+
+if __name__ == "__main__":
+    main()
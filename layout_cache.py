@@ -0,0 +1,88 @@
+# layout_cache.py
+
+import hashlib
+import json
+import os
+
+
+class LayoutTemplateStore:
+    """
+    Column definitions keyed by a fingerprint of the header rows.
+
+    A fingerprint is a tuple of the header words' normalized text and
+    rounded x0, in the order the page yields them, ending with the page
+    width (which bounds the last column). Entries persist as JSON at
+    `path`, under a SHA-1 of the fingerprint computed only when saving.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path=None):
+        self.path = path
+        self.templates = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.templates = {
+                    self._from_json(entry["key"]): entry["columns"]
+                    for entry in data["templates"].values()
+                }
+
+    def _normalize(self, text):
+        return text.upper().replace(" ", "").replace("/", "").replace(".", "")
+
+    def fingerprint(self, words_list, page_width):
+        # a header costs ~15us to extract, so this stays a plain tuple;
+        # sorting or hashing here made a hit slower than a miss
+        key = [
+            (self._normalize(w['text']), round(w['x0'], 1))
+            for row in words_list for w in row
+        ]
+        key.append(round(page_width, 1))
+        return tuple(key)
+
+    def _from_json(self, key):
+        return tuple(tuple(t) if isinstance(t, list) else t for t in key)
+
+    def get(self, key):
+        """The cached columns, shared with the store: callers must not modify them."""
+        columns = self.templates.get(key)
+        if columns is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return columns
+
+    def put(self, key, columns):
+        self.templates[key] = [dict(c) for c in columns]
+        self._dirty = True
+
+    def stats(self):
+        return {
+            "templates": len(self.templates),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+
+        templates = {}
+        for key, columns in self.templates.items():
+            raw = json.dumps(key, separators=(",", ":"))
+            templates[hashlib.sha1(raw.encode("utf-8")).hexdigest()] = {
+                "key": key, "columns": columns
+            }
+
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "templates": templates}, f)
+        os.replace(tmp, self.path)
+        self._dirty = False
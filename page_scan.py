@@ -0,0 +1,111 @@
+# page_scan.py
+
+import ctypes
+
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_raw
+except ImportError:  # pdfplumber < 0.11 does not depend on it
+    pdfium = None
+
+
+PAGE_TABLE = "table"
+PAGE_METADATA = "metadata"
+PAGE_SKIP = "skip"
+
+# normalized (upper-case, no whitespace, "." or "/") text markers, matching
+# what the parser's line checks can possibly fire on
+MARKERS = {
+    "justices": ("HON",),
+    "date": ("DAILYCAUSELISTFORDATED",),
+    "court_no": ("COURTNO",),
+    # the parser looks for "NEW DELHI" within one line, but pdfium's text
+    # order need not keep the two words next to each other
+    "table_end": ("NEW", "DELHI"),
+    "header": ("SNO", "CASE"),
+}
+
+# pdfplumber colors are rounded to one decimal, so any channel in
+# [0.75, 0.85) ends up as HEADER_GRAY's 0.8
+GRAY_RANGE = (190, 218)
+
+
+class PageScanner:
+    """
+    Cheap per-page pre-scan using pdfium's text layer and path fills.
+
+    The scan is conservative: a page is only classified as skippable when
+    the full extractor could not have changed the parser state on it.
+    Without pypdfium2 every page is reported as a table page.
+    """
+
+    def __init__(self, source):
+        self._doc = pdfium.PdfDocument(source.stream()) if pdfium else None
+
+    @property
+    def available(self):
+        return self._doc is not None
+
+    def _normalize(self, text):
+        return "".join(text.upper().split()).replace(".", "").replace("/", "")
+
+    def _has_gray_fill(self, page):
+        r, g, b, a = (ctypes.c_uint() for _ in range(4))
+        lo, hi = GRAY_RANGE
+
+        for obj in page.get_objects(filter=(pdfium_raw.FPDF_PAGEOBJ_PATH,), max_depth=15):
+            if not pdfium_raw.FPDFPageObj_GetFillColor(obj.raw, r, g, b, a):
+                continue
+            if all(lo <= c.value <= hi for c in (r, g, b)):
+                return True
+
+        return False
+
+    def scan(self, page_no):
+        if not self.available:
+            return None
+
+        page = self._doc[page_no - 1]
+        textpage = page.get_textpage()
+
+        try:
+            char_count = textpage.count_chars()
+            text = self._normalize(textpage.get_text_range()) if char_count else ""
+
+            markers = {
+                name for name, tokens in MARKERS.items()
+                if all(token in text for token in tokens)
+            }
+
+            return {
+                "has_text": char_count > 0,
+                "markers": markers,
+                "has_gray": self._has_gray_fill(page),
+            }
+        finally:
+            textpage.close()
+            page.close()
+
+    def close(self):
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+
+def classify_page(scan, in_table):
+    """
+    Classify a scanned page given whether a table is open when it starts.
+
+    Table pages need full extraction for rows. Metadata pages still need it
+    so justices/date/court lines are grouped exactly as the parser does,
+    but can never emit rows. Skippable pages cannot change the state.
+    """
+    if scan is None:
+        return PAGE_TABLE
+    if not scan["has_text"]:
+        return PAGE_SKIP
+    if in_table or scan["has_gray"] or "header" in scan["markers"]:
+        return PAGE_TABLE
+    if scan["markers"] & {"justices", "date", "court_no"}:
+        return PAGE_METADATA
+    return PAGE_SKIP
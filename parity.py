@@ -0,0 +1,373 @@
+# parity.py
+
+import argparse
+import difflib
+import json
+import os
+import sys
+import time
+
+from consumers import QueueConsumer, stream_rows
+from debug4_enhanced import SupremeCourtParser
+from layout_cache import LayoutTemplateStore
+from pdf_parser import PDFTableParser
+from pdf_source import PDFSource
+from row_merger import RowMerger
+from shard import parse_page_shard, parse_shard, plan, resolve, stitch
+from synthetic import SyntheticCauseList
+
+
+PDF = "pdf"
+PAGES = "pages"
+
+BUNDLED_PDFS = ["cause_list20251230.pdf", "CauseList20171004.pdf"]
+
+# name -> (fn, input kinds, select, multicore); fn(input, **selection)
+# returns (raw_rows, merged_rows or the exception merging raised), where
+# input is a PDFSource or a list of pages. select(reference_rows), when
+# given, picks the parser selection and the engine is checked against the
+# reference rows that selection keeps. multicore engines only gain speed
+# with more than one core, so on one core their timing is informational.
+ENGINES = {}
+
+
+def engine(name, kinds=(PDF, PAGES), select=None, multicore=False):
+    def register(fn):
+        ENGINES[name] = (fn, set(kinds), select, multicore)
+        return fn
+    return register
+
+
+def merged(rows):
+    try:
+        return RowMerger().merge([list(r) for r in rows])
+    except ValueError as e:
+        return e
+
+
+# ---------- reference implementations ----------
+
+@engine("reference", kinds=(PDF,))
+def run_reference(source):
+    parser = SupremeCourtParser(source.stream())
+    parser.run()
+    raw = [list(r) for r in parser.extracted_rows]
+    try:
+        parser.merge_extracted_rows()
+        return raw, parser.extracted_rows
+    except ValueError as e:
+        return raw, e
+
+
+@engine("pipeline")
+def run_pipeline(data):
+    if isinstance(data, PDFSource):
+        rows = PDFTableParser(data).run()
+    else:
+        rows = PDFTableParser().parse_pages(data)
+    return rows, merged(rows)
+
+
+# ---------- optimized engines ----------
+
+@engine("parallel", kinds=(PDF,), multicore=True)
+def run_parallel(source):
+    rows = PDFTableParser(source, workers=max(os.cpu_count() or 1, 2)).run()
+    return rows, merged(rows)
+
+
+@engine("prescan", kinds=(PDF,))
+def run_prescan(source):
+    rows = PDFTableParser(source, prescan=True).run()
+    return rows, merged(rows)
+
+
+_layout_store = LayoutTemplateStore()
+
+
+@engine("layout_cache")
+def run_layout_cache(data):
+    # the store is shared across runs, so --repeat measures the warm cache
+    if isinstance(data, PDFSource):
+        rows = PDFTableParser(data, layout_store=_layout_store).run()
+    else:
+        rows = PDFTableParser(layout_store=_layout_store).parse_pages(data)
+    return rows, merged(rows)
+
+
+SHARDS = 3
+
+
+@engine("sharded", multicore=True)
+def run_sharded(data):
+    # every shard starts cold, as independent nodes would; stitching
+    # replays the ones whose guessed entry state was wrong
+    if isinstance(data, PDFSource):
+        with data.open() as pdf:
+            page_count = len(pdf.pages)
+        shards = [parse_shard(data, a, b) for a, b in plan(page_count, SHARDS)]
+    else:
+        shards = [
+            parse_page_shard(data[a - 1:b], a)
+            for a, b in plan(len(data), SHARDS)
+        ]
+
+    shards, _ = resolve(shards)
+    rows = [r for s in shards for r in s["rows"]]
+    try:
+        return rows, stitch(shards)[1]
+    except ValueError as e:
+        return rows, e
+
+
+class _Collector(QueueConsumer):
+    def __init__(self):
+        super().__init__()
+        self.merged = []
+
+    def consume(self, rows):
+        self.merged.extend(rows)
+
+
+@engine("streaming", multicore=True)
+def run_streaming(data):
+    collector = _Collector()
+    if isinstance(data, PDFSource):
+        parser, pages = PDFTableParser(data), None
+    else:
+        parser, pages = PDFTableParser(), data
+
+    try:
+        rows = stream_rows(parser, [collector], pages)
+    except ValueError as e:
+        # streaming stops at the first merge error, before the document's
+        # later pages are parsed, so only the outcome is comparable
+        return run_pipeline(data)[0], e
+    return rows, collector.merged
+
+
+# a courtroom / judge from the middle of the document, so sections are
+# skipped both before and after the selected one
+def _select_court(rows):
+    return {"courts": [rows[len(rows) // 2][5]]} if rows else {"courts": ["1"]}
+
+
+def _select_judge(rows):
+    return {"judges": [rows[len(rows) // 2][4].split("|")[0].strip()]} if rows else {"judges": ["-"]}
+
+
+def _selected_rows(rows, courts=(), judges=()):
+    """
+    Reference rows a selection must keep, found without the parser's
+    matcher: the exact Court No, or a judge equal to a whole bench line.
+    """
+    return [
+        r for r in rows
+        if r[5] in courts
+        or any(j.strip() in judges for j in (r[4] or "").split("|"))
+    ]
+
+
+def run_selective(data, **selection):
+    if isinstance(data, PDFSource):
+        rows = PDFTableParser(data, **selection).run()
+    else:
+        rows = PDFTableParser(**selection).parse_pages(data)
+    return rows, merged(rows)
+
+
+engine("selective_court", select=_select_court)(run_selective)
+engine("selective_judge", select=_select_judge)(run_selective)
+
+
+# ---------- comparison ----------
+
+def _normalize(rows):
+    if isinstance(rows, Exception):
+        return rows
+    # JSON round trip so tuples/lists and int/str page numbers compare as stored
+    return [tuple(r) for r in json.loads(json.dumps(rows))]
+
+
+def diff_rows(expected, actual, limit=20):
+    """Row-level diff; returns a list of human-readable lines (empty when identical)."""
+    if isinstance(expected, Exception) or isinstance(actual, Exception):
+        if type(expected) is type(actual):
+            return []
+        return [f"outcome differs: expected {expected!r}, got {actual!r}"]
+
+    if expected == actual:
+        return []
+
+    lines = [f"{len(expected)} expected rows, {len(actual)} actual rows"]
+    matcher = difflib.SequenceMatcher(a=expected, b=actual, autojunk=False)
+
+    for op, a0, a1, b0, b1 in matcher.get_opcodes():
+        if op == "equal":
+            continue
+        if op == "replace" and a1 - a0 == b1 - b0:
+            for i, j in zip(range(a0, a1), range(b0, b1)):
+                cols = [
+                    f"col {c}: {x!r} != {y!r}"
+                    for c, (x, y) in enumerate(zip(expected[i], actual[j]))
+                    if x != y
+                ]
+                lines.append(f"row {i}/{j} changed: " + "; ".join(cols))
+        else:
+            for i in range(a0, a1):
+                lines.append(f"- row {i}: {expected[i]!r}")
+            for j in range(b0, b1):
+                lines.append(f"+ row {j}: {actual[j]!r}")
+
+        if len(lines) > limit:
+            lines = lines[:limit] + ["..."]
+            break
+
+    return lines
+
+
+def timed_run(fn, data, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def timed_pair(baseline, fn, data, repeat):
+    """
+    Alternate baseline and fn runs, so drift in machine load hits both
+    alike. Returns fn's result and the best time of each.
+    """
+    baseline_s = elapsed = None
+    result = None
+    for _ in range(repeat):
+        _, t = timed_run(baseline, data, 1)
+        baseline_s = t if baseline_s is None else min(baseline_s, t)
+        result, t = timed_run(fn, data, 1)
+        elapsed = t if elapsed is None else min(elapsed, t)
+    return result, baseline_s, elapsed
+
+
+def check_input(label, data, kind, engines, repeat, min_speedup, tolerance, out):
+    reference = "reference" if kind == PDF else "pipeline"
+    (ref_raw, ref_merged), ref_s = timed_run(ENGINES[reference][0], data, repeat)
+    ref_raw, ref_merged = _normalize(ref_raw), _normalize(ref_merged)
+
+    cores = os.cpu_count() or 1
+    out.write(
+        f"== {label}: reference={reference} {ref_s:.2f}s, {repeat} alternating run(s), "
+        f"pass at x{min_speedup:.2f} - {tolerance:.2f}, {cores} core(s)\n"
+    )
+
+    failures = 0
+    for name in engines:
+        fn, kinds, select, multicore = ENGINES[name]
+        if name == reference or kind not in kinds:
+            continue
+
+        selection, expected_raw, expected_merged = {}, ref_raw, ref_merged
+        if select:
+            selection = select(ref_raw)
+            expected_raw = _selected_rows(ref_raw, **selection)
+            expected_merged = _normalize(merged(expected_raw))
+
+        (raw, rows), baseline_s, elapsed = timed_pair(
+            run_pipeline, lambda d: fn(d, **selection), data, repeat
+        )
+        raw_diff = diff_rows(expected_raw, _normalize(raw))
+        merged_diff = diff_rows(expected_merged, _normalize(rows))
+        speedup = baseline_s / elapsed if elapsed else float("inf")
+
+        identical = not raw_diff and not merged_diff
+        fast = name == "pipeline" or speedup >= min_speedup - tolerance
+        if not identical:
+            status = "FAIL"
+        elif fast:
+            status = "PASS"
+        elif multicore and cores == 1:
+            # nothing to run in parallel with; a slowdown here says nothing
+            status = "INFO"
+        else:
+            status = "FAIL"
+        failures += status == "FAIL"
+
+        out.write(
+            f"  {name:<14} {status}  "
+            f"{'identical' if identical else 'DIFFERENT'}  "
+            f"{elapsed:.2f}s vs pipeline {baseline_s:.2f}s  x{speedup:.2f}"
+            + ("  (multi-core engine)" if multicore else "")
+            + (f"  {selection} ({len(expected_raw)}/{len(ref_raw)} rows)" if selection else "")
+            + "\n"
+        )
+        for section, lines in (("parsed", raw_diff), ("merged", merged_diff)):
+            for line in lines:
+                out.write(f"      [{section}] {line}\n")
+
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Check engines against the reference parser for identical output and speedup"
+    )
+    ap.add_argument("--pdf", nargs="*", default=BUNDLED_PDFS)
+    ap.add_argument("--synthetic-pages", type=int, nargs="*", default=[300])
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--engines", nargs="*", default=None, help="default: all registered")
+    ap.add_argument(
+        "--repeat", type=int, default=3,
+        help="runs per engine, alternating with the pipeline baseline; best times are compared"
+    )
+    ap.add_argument("--min-speedup", type=float, default=1.0)
+    ap.add_argument(
+        "--tolerance", type=float, default=0.05,
+        help="speedups down to min-speedup minus this pass, to absorb timing noise"
+    )
+    ap.add_argument("--report", default=None, help="also write the report to this file")
+    args = ap.parse_args()
+    if args.repeat < 1:
+        ap.error("--repeat must be at least 1")
+
+    engines = args.engines or list(ENGINES)
+    unknown = set(engines) - set(ENGINES)
+    if unknown:
+        ap.error(f"unknown engines: {', '.join(sorted(unknown))}")
+
+    inputs = [(path, PDFSource(path), PDF) for path in args.pdf]
+    inputs += [
+        (f"synthetic {n} pages seed {args.seed}",
+         list(SyntheticCauseList(pages=n, seed=args.seed)), PAGES)
+        for n in args.synthetic_pages
+    ]
+
+    class Tee:
+        def __init__(self, *streams):
+            self.streams = streams
+
+        def write(self, text):
+            for s in self.streams:
+                s.write(text)
+
+    report = open(args.report, "w", encoding="utf-8") if args.report else None
+    out = Tee(sys.stdout, report) if report else sys.stdout
+
+    try:
+        failures = sum(
+            check_input(
+                label, data, kind, engines, args.repeat, args.min_speedup,
+                args.tolerance, out
+            )
+            for label, data, kind in inputs
+        )
+    finally:
+        if report:
+            report.close()
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,60 @@
 # pdf_parser.py
 
-import pdfplumber
+import copy
+import multiprocessing
 import re
+import sys
 from config import HEADERS, HEADER_GRAY, WHITE, TABLE_END_X_TOLERANCE
+from pdf_source import PDFSource
+from page_scan import PageScanner, PAGE_SKIP, PAGE_TABLE, classify_page
+
+
+WORD_KEYS = ("text", "x0", "x1", "top", "bottom")
+RECT_KEYS = ("x0", "x1", "top", "bottom", "non_stroking_color")
+
+
+def extract_page(page):
+    """Reduce a pdfplumber page to the plain words/rects the parser reads."""
+    return {
+        "width": page.width,
+        "words": [
+            {k: w[k] for k in WORD_KEYS}
+            for w in page.extract_words(x_tolerance=2)
+        ],
+        "rects": [{k: r.get(k) for k in RECT_KEYS} for r in page.rects],
+    }
+
+
+# ---------- worker processes ----------
+
+_worker_pdf = None
+
+
+def _init_worker(source):
+    global _worker_pdf
+    _worker_pdf = PDFSource.attach(source).open()
+
+
+def _extract_worker_page(page_no):
+    return extract_page(_worker_pdf.pages[page_no - 1])
 
 
 class PDFTableParser:
-    def __init__(self, file_path):
+    def __init__(self, file_path=None, workers=1, prescan=False, layout_store=None,
+                 courts=None, judges=None):
+        # file_path may be None when pages are fed to parse_pages directly
         self.file_path = file_path
+        self.source = PDFSource.from_input(file_path) if file_path is not None else None
+        self.workers = workers
+        self.prescan = prescan
+        self.layout_store = layout_store
+        self.page_kinds = {}
+
+        # selective mode: keep only rows of table sections whose court
+        # number is in courts or whose bench includes one of judges
+        self.courts = {self._court_key(c) for c in courts} if courts else None
+        self.judges = [self._name_tokens(j) for j in judges] if judges else None
+        self._selected = {}
         self._is_parsing_table = False
         self._columns = []
 
@@ -29,11 +76,11 @@ class PDFTableParser:
             color = (color,)
         return tuple(round(float(c), 1) for c in color)
 
-    def get_bg_color(self, word, page):
+    def get_bg_color(self, word, rects):
         mid_x = (word['x0'] + word['x1']) / 2
         mid_y = (word['top'] + word['bottom']) / 2
 
-        for r in page.rects:
+        for r in rects:
             if r['x0'] <= mid_x <= r['x1'] and r['top'] <= mid_y <= r['bottom']:
                 return self.normalize_color(r.get('non_stroking_color'))
 
@@ -42,6 +89,78 @@ class PDFTableParser:
     def _normalize_for_match(self, text):
         return text.upper().replace(" ", "").replace("/", "").replace(".", "")
 
+    def _name_tokens(self, text):
+        # words without their dots, so "J.K." and "J. K." both give J, K
+        return re.findall(r"[\w']+", text.upper())
+
+    def _court_key(self, court_no):
+        # court numbers compare as integers, so 1 matches 01
+        court_no = str(court_no).strip()
+        return int(court_no) if court_no.isdigit() else court_no.upper()
+
+    def _names_match(self, name, line):
+        """
+        Whether the name's words appear as whole consecutive words of line,
+        ignoring the spaces between them, so "JK" also finds "J. K.".
+        """
+        target = "".join(name)
+        for i in range(len(line)):
+            joined = ""
+            for word in line[i:]:
+                joined += word
+                if not target.startswith(joined):
+                    break
+                if joined == target:
+                    return True
+        return False
+
+    # ---------- selective mode ----------
+
+    @property
+    def selective(self):
+        return self.courts is not None or self.judges is not None
+
+    def section_selected(self, court_no, justices):
+        """Whether a section's rows are kept; justices is the " | "-joined string rows carry."""
+        key = (court_no, justices)
+        selected = self._selected.get(key)
+
+        if selected is None:
+            bench = [self._name_tokens(j) for j in justices.split("|")]
+            selected = self._selected[key] = bool(
+                (self.courts and court_no is not None
+                 and self._court_key(court_no) in self.courts)
+                or (self.judges and any(
+                    self._names_match(name, line)
+                    for name in self.judges for line in bench
+                ))
+            )
+
+        return selected
+
+    def _process_selected(self, page_no, page):
+        start = len(self.extracted_rows)
+        self.process_page(page_no, page)
+
+        if self.selective:
+            self.extracted_rows[start:] = [
+                r for r in self.extracted_rows[start:]
+                if self.section_selected(r[5], r[4])
+            ]
+
+    def _in_unselected_section(self):
+        # inside a table the only line that changes state is the NEW DELHI
+        # table end, so pages without it in a section nobody asked for can
+        # only add rows that would be dropped anyway
+        return (
+            self.selective
+            and self._is_parsing_table
+            and not self.section_selected(
+                self._current_session["court_no"],
+                " | ".join(self._current_session["justices"])
+            )
+        )
+
     # ---------- header extraction ----------
 
     def extract_header_definition(self, words_list, page_width):
@@ -98,6 +217,19 @@ class PDFTableParser:
 
         return temp_cols
 
+    def header_columns(self, words_list, page_width):
+        if self.layout_store is None:
+            return self.extract_header_definition(words_list, page_width)
+
+        key = self.layout_store.fingerprint(words_list, page_width)
+        columns = self.layout_store.get(key)
+
+        if columns is None:
+            columns = self.extract_header_definition(words_list, page_width)
+            self.layout_store.put(key, columns)
+
+        return columns
+
     # ---------- row processing ----------
 
     def process_line(self, line_words):
@@ -111,103 +243,201 @@ class PDFTableParser:
 
         return row_data
 
+    # ---------- page extraction ----------
+
+    def _extract_parallel(self, page_numbers):
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+        # forked workers inherit the mapped buffer; spawned ones attach to it
+        forked = ctx.get_start_method() == "fork"
+        handle = self.source if forked else self.source.share()
+
+        try:
+            with ctx.Pool(
+                self.workers, initializer=_init_worker, initargs=(handle,)
+            ) as pool:
+                yield from pool.imap(_extract_worker_page, page_numbers)
+        finally:
+            if not forked:
+                self.source.unshare()
+
+    def _open_scanner(self):
+        if not (self.prescan or self.selective):
+            return None
+
+        scanner = PageScanner(self.source)
+        if not scanner.available:
+            scanner.close()
+            return None
+        return scanner
+
+    def _page_kind(self, scanner, page_no):
+        """
+        Classify a page just before it is parsed. Pages that start inside
+        an open table are table pages whatever they hold, so they are only
+        scanned when a selective run could skip them up to the table end.
+        """
+        if scanner is None:
+            return PAGE_TABLE
+
+        unselected = self._in_unselected_section()
+        if self._is_parsing_table and not unselected:
+            return PAGE_TABLE
+
+        scan = scanner.scan(page_no)
+        if unselected and "table_end" not in scan["markers"]:
+            return PAGE_SKIP
+        return classify_page(scan, self._is_parsing_table)
+
+    # ---------- state handoff ----------
+
+    def get_state(self):
+        """Everything that carries from one page to the next, as plain data."""
+        return copy.deepcopy({
+            "is_parsing_table": self._is_parsing_table,
+            "columns": self._columns,
+            "session": self._current_session,
+        })
+
+    def set_state(self, state):
+        state = copy.deepcopy(state)
+        self._is_parsing_table = state["is_parsing_table"]
+        self._columns = state["columns"]
+        self._current_session = state["session"]
+
     # ---------- main run ----------
 
-    def run(self):
-        with pdfplumber.open(self.file_path) as pdf:
-            for page_no, page in enumerate(pdf.pages, start=1):
-                words = page.extract_words(x_tolerance=2)
-                lines = {}
-
-                for w in words:
-                    lines.setdefault(round(w["top"], 1), []).append(w)
-
-                possible_header_rows = []
-                is_collecting_header = False
-
-                for top in sorted(lines.keys()):
-                    line_words = sorted(lines[top], key=lambda w: w['x0'])
-                    line_text = " ".join(w["text"] for w in line_words)
-                    upper_text = line_text.upper()
-
-                    parse_metadata = not self._is_parsing_table
-
-                    # table end
-                    if (
-                        self._is_parsing_table
-                        and "NEW DELHI" in upper_text
-                        and abs(line_words[0]['x0'] - self._columns[0]['x0']) <= TABLE_END_X_TOLERANCE
-                    ):
-                        self._is_parsing_table = False
-                        self._columns = []
-                        self._current_session = {
-                            "date": None,
-                            "court": "NEW DELHI",
-                            "court_no": None,
-                            "justices": []
-                        }
+    def run(self, start_page=None, end_page=None, on_page=None):
+        with self.source.open() as pdf:
+            page_numbers = range(
+                start_page or 1, min(end_page or len(pdf.pages), len(pdf.pages)) + 1
+            )
+            scanner = self._open_scanner()
+
+            # workers extract every page ahead; skipped ones are just dropped
+            if self.workers > 1:
+                prefetched = self._extract_parallel(page_numbers)
+
+            try:
+                for page_no in page_numbers:
+                    kind = self.page_kinds[page_no] = self._page_kind(scanner, page_no)
+
+                    page = next(prefetched) if self.workers > 1 else None
+                    if kind == PAGE_SKIP:
                         continue
 
-                    if parse_metadata:
-                        if line_words[0]["text"].upper().startswith("HON"):
-                            self._current_session["justices"].append(line_text.strip())
-
-                        date_match = re.search(
-                            r"DAILY\s+CAUSE\s+LIST\s+FOR\s+DATED\s*[:\-]?\s*(\d{2}[-/]\d{2}[-/]\d{4})",
-                            line_text,
-                            re.IGNORECASE
-                        )
-                        if date_match:
-                            self._current_session["date"] = date_match.group(1)
-
-                        court_no_match = re.search(
-                            r"COURT\s*NO\.?\s*[:\-]?\s*(\d+)",
-                            line_text,
-                            re.IGNORECASE
-                        )
-                        if court_no_match:
-                            self._current_session["court_no"] = court_no_match.group(1)
-
-                        is_header_by_text = all(
-                            h.replace(".", "") in self._normalize_for_match(upper_text)
-                            for h in ["SNO", "CASE"]
-                        )
-
-                        is_header_by_color = (
-                            self.get_bg_color(line_words[0], page) == HEADER_GRAY
-                        )
-
-                        if is_header_by_color or is_header_by_text:
-                            is_collecting_header = True
-                            possible_header_rows.append(line_words)
-                            self._is_parsing_table = False
-                            continue
-
-                        if is_collecting_header:
-                            self._columns = self.extract_header_definition(
-                                possible_header_rows, page.width
-                            )
-                            self._is_parsing_table = True
-                            is_collecting_header = False
-                            possible_header_rows = []
-                            continue
-
-                    if self._is_parsing_table and self._columns:
-                        if "DAILY CAUSE LIST FOR DATED" in upper_text or "COURT NO" in upper_text:
-                            continue
-
-                        row = self.process_line(line_words)
-                        if not any(row):
-                            continue
-
-                        self.extracted_rows.append(
-                            row + [
-                                " | ".join(self._current_session["justices"]),
-                                self._current_session["court_no"],
-                                self._current_session["court"],
-                                self._current_session["date"],
-                                page_no
-                            ]
-                        )
+                    if page is None:
+                        page = extract_page(pdf.pages[page_no - 1])
 
+                    if on_page:
+                        on_page(page_no, page)
+                    self._process_selected(page_no, page)
+            finally:
+                if scanner is not None:
+                    scanner.close()
+
+        return self.extracted_rows
+
+    def parse_pages(self, pages, start_page=1, on_page=None):
+        """Run the state machine over pages already in extract_page form."""
+        for page_no, page in enumerate(pages, start=start_page):
+            if on_page:
+                on_page(page_no, page)
+            self._process_selected(page_no, page)
         return self.extracted_rows
+
+    def process_page(self, page_no, page):
+        lines = {}
+
+        for w in page["words"]:
+            lines.setdefault(round(w["top"], 1), []).append(w)
+
+        possible_header_rows = []
+        is_collecting_header = False
+
+        for top in sorted(lines.keys()):
+            line_words = sorted(lines[top], key=lambda w: w['x0'])
+            line_text = " ".join(w["text"] for w in line_words)
+            upper_text = line_text.upper()
+
+            parse_metadata = not self._is_parsing_table
+
+            # table end
+            if (
+                self._is_parsing_table
+                and "NEW DELHI" in upper_text
+                and abs(line_words[0]['x0'] - self._columns[0]['x0']) <= TABLE_END_X_TOLERANCE
+            ):
+                self._is_parsing_table = False
+                self._columns = []
+                self._current_session = {
+                    "date": None,
+                    "court": "NEW DELHI",
+                    "court_no": None,
+                    "justices": []
+                }
+                continue
+
+            if parse_metadata:
+                if line_words[0]["text"].upper().startswith("HON"):
+                    self._current_session["justices"].append(line_text.strip())
+
+                date_match = re.search(
+                    r"DAILY\s+CAUSE\s+LIST\s+FOR\s+DATED\s*[:\-]?\s*(\d{2}[-/]\d{2}[-/]\d{4})",
+                    line_text,
+                    re.IGNORECASE
+                )
+                if date_match:
+                    self._current_session["date"] = date_match.group(1)
+
+                court_no_match = re.search(
+                    r"COURT\s*NO\.?\s*[:\-]?\s*(\d+)",
+                    line_text,
+                    re.IGNORECASE
+                )
+                if court_no_match:
+                    self._current_session["court_no"] = court_no_match.group(1)
+
+                is_header_by_text = all(
+                    h.replace(".", "") in self._normalize_for_match(upper_text)
+                    for h in ["SNO", "CASE"]
+                )
+
+                is_header_by_color = (
+                    self.get_bg_color(line_words[0], page["rects"]) == HEADER_GRAY
+                )
+
+                if is_header_by_color or is_header_by_text:
+                    is_collecting_header = True
+                    possible_header_rows.append(line_words)
+                    self._is_parsing_table = False
+                    continue
+
+                if is_collecting_header:
+                    self._columns = self.header_columns(
+                        possible_header_rows, page["width"]
+                    )
+                    self._is_parsing_table = True
+                    is_collecting_header = False
+                    possible_header_rows = []
+                    continue
+
+            if self._is_parsing_table and self._columns:
+                if "DAILY CAUSE LIST FOR DATED" in upper_text or "COURT NO" in upper_text:
+                    continue
+
+                row = self.process_line(line_words)
+                if not any(row):
+                    continue
+
+                self.extracted_rows.append(
+                    row + [
+                        # one shared string per bench rather than one per row
+                        sys.intern(" | ".join(self._current_session["justices"])),
+                        self._current_session["court_no"],
+                        self._current_session["court"],
+                        self._current_session["date"],
+                        page_no
+                    ]
+                )
@@ -0,0 +1,179 @@
+# pdf_source.py
+
+import hashlib
+import io
+import mmap
+import os
+
+import pdfplumber
+
+
+class _BufferReader(io.RawIOBase):
+    """Seekable read-only stream over a shared buffer; reads copy only the requested slice."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._buffer) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+
+        if pos < 0:
+            raise ValueError("Negative seek position")
+
+        self._pos = pos
+        return pos
+
+    def readinto(self, b):
+        chunk = self._buffer[self._pos:self._pos + len(b)]
+        n = len(chunk)
+        b[:n] = chunk
+        self._pos += n
+        return n
+
+
+class PDFSource:
+    """
+    A PDF input given as a path, bytes, BytesIO or mmap.
+
+    Every consumer reads from one buffer: paths are memory-mapped once,
+    in-memory inputs are used as-is, and the content hash is computed
+    over that same buffer.
+
+    The buffer is taken on first use and given back by close() (or on
+    leaving a with block), after which the caller may resize or close its
+    BytesIO or mmap again. A closed source takes the buffer again if it
+    is used later.
+    """
+
+    def __init__(self, data):
+        self.path = None
+        self._data = None
+        self._buffer = None
+        self._mmap = None
+        self._hash = None
+        self._shm = None
+        self._attached = None
+
+        if isinstance(data, (str, os.PathLike)):
+            self.path = os.fspath(data)
+        elif isinstance(data, (io.BytesIO, bytes, bytearray, memoryview, mmap.mmap)):
+            self._data = data
+        else:
+            raise TypeError(f"Unsupported PDF input: {type(data).__name__}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @classmethod
+    def from_input(cls, data):
+        if isinstance(data, cls):
+            return data
+        return cls(data)
+
+    # ---------- buffer ----------
+
+    @property
+    def buffer(self):
+        # the only long-lived view on the input; readers share it, so
+        # releasing it in close() frees the input for its owner
+        if self._buffer is None:
+            if self.path is not None:
+                with open(self.path, "rb") as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._buffer = memoryview(self._mmap)
+            elif isinstance(self._data, io.BytesIO):
+                self._buffer = self._data.getbuffer()
+            else:
+                self._buffer = memoryview(self._data)
+        return self._buffer
+
+    @property
+    def content_hash(self):
+        if self._hash is None:
+            self._hash = hashlib.sha256(self.buffer).hexdigest()
+        return self._hash
+
+    def stream(self):
+        return _BufferReader(self.buffer)
+
+    def open(self):
+        return pdfplumber.open(self.stream())
+
+    # ---------- worker handoff ----------
+
+    def share(self):
+        """
+        Return a picklable handle that a spawned worker passes to `attach`.
+
+        Path inputs are re-mapped by each worker, so the OS page cache holds
+        the only copy. In-memory inputs are copied once into a named shared
+        memory block, freed by `unshare`. Forked workers do not need this:
+        they inherit the mapping directly.
+        """
+        if self.path is not None:
+            return ("path", self.path)
+
+        from multiprocessing import shared_memory
+
+        if self._shm is None:
+            size = len(self.buffer)
+            self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            self._shm.buf[:size] = self.buffer
+        return ("shm", self._shm.name, len(self.buffer))
+
+    def unshare(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    @classmethod
+    def attach(cls, handle):
+        if isinstance(handle, cls):
+            return handle
+
+        if handle[0] == "path":
+            return cls(handle[1])
+
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name=handle[1])
+        source = cls(shm.buf[:handle[2]])
+        source._attached = shm
+        return source
+
+    def close(self):
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        if self._attached is not None:
+            # the slice of the shared block this source was built on
+            self._data.release()
+            self._data = None
+            self._attached.close()
+            self._attached = None
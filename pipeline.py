@@ -1,20 +1,51 @@
 # pipeline.py
 
 import csv
+from consumers import CSVWriter, SQLiteWriter, stream_rows
 from pdf_parser import PDFTableParser
+from pdf_source import PDFSource
 from row_merger import RowMerger
 from sqlite_repository import SQLiteCauseListRepository
-from config import HEADERS
+from config import (
+    CSV_PATH, HEADERS, METADATA_HEADERS, WRITER_BATCH_SIZE
+)
+from layout_cache import LayoutTemplateStore
 
 
 class CauseListPipeline:
-    def __init__(self, pdf_path, db_path):
+    def __init__(self, pdf_path, db_path, workers=1, layout_cache=None,
+                 streaming=False, batch_size=WRITER_BATCH_SIZE, prescan=False):
+        # pdf_path may also be bytes, a BytesIO or an mmap
+        self.source = PDFSource.from_input(pdf_path)
         self.pdf_path = pdf_path
         self.db_path = db_path
+        self.workers = workers
+        # classify pages with the cheap pdfium scan and skip those that
+        # cannot change the parser state (see PDFTableParser._page_kind)
+        self.prescan = prescan
+        # path of a persisted header layout cache (config.LAYOUT_CACHE_PATH);
+        # off by default, as headers are few and cheap to extract
+        self.layout_store = LayoutTemplateStore(layout_cache) if layout_cache else None
+        # overlap parsing with the SQLite and CSV writes (see run_streaming)
+        self.streaming = streaming
+        self.batch_size = batch_size
+
+    @property
+    def content_hash(self):
+        return self.source.content_hash
 
     def run(self):
-        parser = PDFTableParser(self.pdf_path)
-        rows = parser.run()
+        if self.streaming:
+            return self.run_streaming()
+
+        parser = PDFTableParser(
+            self.source, workers=self.workers, prescan=self.prescan,
+            layout_store=self.layout_store
+        )
+        with self.source:
+            rows = parser.run()
+        if self.layout_store:
+            self.layout_store.save()
 
         rows = RowMerger().merge(rows)
 
@@ -24,8 +55,29 @@ class CauseListPipeline:
 
         self.export_csv(rows)
 
+    def run_streaming(self):
+        """
+        Same output as run(), but cases are handed to a SQLite writer
+        thread and a CSV writer thread as soon as a later SNO closes them,
+        so the database commits in batch_size batches while later pages
+        are still being parsed. The batches go to a staging copy of the
+        date that replaces the stored list only once parsing succeeds.
+        """
+        parser = PDFTableParser(
+            self.source, workers=self.workers, prescan=self.prescan,
+            layout_store=self.layout_store
+        )
+        consumers = [
+            SQLiteWriter(SQLiteCauseListRepository(self.db_path), self.batch_size),
+            CSVWriter(CSV_PATH),
+        ]
+        with self.source:
+            stream_rows(parser, consumers)
+        if self.layout_store:
+            self.layout_store.save()
+
     def export_csv(self, rows):
-        with open("cause_list_results.csv", "w", newline="", encoding="utf-8") as f:
+        with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow(HEADERS + ["Judges", "Court No", "Court", "Date", "Page No"])
+            writer.writerow(HEADERS + METADATA_HEADERS)
             writer.writerows(rows)
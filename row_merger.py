@@ -8,6 +8,19 @@ class RowMerger:
         if not rows:
             return rows
 
+        merged, current = self.merge_open(rows)
+        if current:
+            merged.append(current)
+
+        return merged
+
+    def merge_open(self, rows, current=None):
+        """
+        Merge rows onto `current`, a case still open from earlier rows.
+
+        Returns the cases closed by a later SNO and the case left open, so
+        merging can resume across batches or shards.
+        """
         header_index = {name: i for i, name in enumerate(HEADERS)}
         sno_index = header_index["SNO."]
 
@@ -27,7 +40,7 @@ class RowMerger:
         page_no_index = metadata_start + 4
 
         merged = []
-        current = None
+        current = current.copy() if current else None
 
         for row in rows:
             raw_sno = row[sno_index].strip() if row[sno_index] else ""
@@ -61,7 +74,4 @@ class RowMerger:
                     if str(val) not in cur:
                         current[i] = f"{cur}, {val}"
 
-        if current:
-            merged.append(current)
-
-        return merged
+        return merged, current
@@ -0,0 +1,226 @@
+# shard.py
+
+import argparse
+import csv
+import json
+import math
+
+from config import HEADERS, METADATA_HEADERS
+from pdf_parser import PDFTableParser
+from pdf_source import PDFSource
+from row_merger import RowMerger
+from sqlite_repository import SQLiteCauseListRepository
+
+
+SHARD_VERSION = 1
+
+
+def _plain(value):
+    # shard files are JSON, so compare states the way they will be stored
+    return json.loads(json.dumps(value))
+
+
+def split_rows(rows, merger=None):
+    """
+    Split a shard's parsed rows into the continuation rows before its first
+    SNO (which belong to the previous shard's open case), the cases it
+    closes, and the case it leaves open.
+    """
+    merger = merger or RowMerger()
+
+    head = 0
+    for row in rows:
+        sno = row[0].strip() if row[0] else ""
+        if sno and not sno.startswith("."):
+            break
+        head += 1
+
+    closed, open_case = merger.merge_open(rows[head:])
+    return {"head": rows[:head], "closed": closed, "open_case": open_case}
+
+
+def plan(page_count, shards):
+    size = math.ceil(page_count / shards)
+    return [
+        (start, min(start + size - 1, page_count))
+        for start in range(1, page_count + 1, size)
+    ]
+
+
+def _record(content_hash, start_page, entry_state, parser, pages):
+    shard = {
+        "version": SHARD_VERSION,
+        "content_hash": content_hash,
+        "start_page": start_page,
+        "end_page": start_page + len(pages) - 1,
+        "entry_state": entry_state,
+        "exit_state": parser.get_state(),
+        "rows": parser.extracted_rows,
+        "pages": pages,
+        "merge_error": None,
+    }
+    try:
+        shard.update(split_rows(parser.extracted_rows))
+    except ValueError as e:
+        # only fatal if the stitch step confirms this shard's entry state
+        shard.update(head=None, closed=None, open_case=None, merge_error=str(e))
+    return _plain(shard)
+
+
+def parse_shard(pdf, start_page, end_page, entry_state=None, workers=1):
+    """
+    Parse pages start_page..end_page from entry_state (a previous shard's
+    exit_state; the document's initial state when omitted).
+
+    The shard keeps its extracted pages, so the merge step can replay them
+    from the true entry state if this one turns out to be a guess.
+    """
+    source = PDFSource.from_input(pdf)
+    parser = PDFTableParser(source, workers=workers)
+    if entry_state is not None:
+        parser.set_state(entry_state)
+
+    entry = parser.get_state()
+    pages = []
+    with source:
+        parser.run(start_page, end_page, on_page=lambda n, page: pages.append(page))
+        content_hash = source.content_hash
+
+    return _record(content_hash, start_page, entry, parser, pages)
+
+
+def parse_page_shard(pages, start_page, entry_state=None, content_hash=None):
+    """Like parse_shard, for pages already in extract_page form."""
+    parser = PDFTableParser()
+    if entry_state is not None:
+        parser.set_state(entry_state)
+
+    entry = parser.get_state()
+    pages = list(pages)
+    parser.parse_pages(pages, start_page=start_page)
+
+    return _record(content_hash, start_page, entry, parser, pages)
+
+
+def resolve(shards):
+    """
+    Check shards cover the document in order and replay any parsed from
+    the wrong entry state, starting from the previous shard's exit state.
+
+    Returns (shards in page order, replayed_shard_count).
+    """
+    shards = sorted(shards, key=lambda s: s["start_page"])
+
+    expected_page = 1
+    for s in shards:
+        if s["version"] != SHARD_VERSION:
+            raise ValueError(f"Unsupported shard version: {s['version']}")
+        if s["content_hash"] != shards[0]["content_hash"]:
+            raise ValueError("Shards come from different documents")
+        if s["start_page"] != expected_page:
+            raise ValueError(f"Missing pages before page {s['start_page']}")
+        expected_page = s["end_page"] + 1
+
+    state = _plain(PDFTableParser().get_state())
+    resolved, replayed = [], 0
+
+    for s in shards:
+        if s["entry_state"] != state:
+            s = parse_page_shard(s["pages"], s["start_page"], state, s["content_hash"])
+            replayed += 1
+        resolved.append(s)
+        state = s["exit_state"]
+
+    return resolved, replayed
+
+
+def stitch(shards):
+    """
+    Combine shard outputs into the parsed and merged rows a single-node
+    run gives.
+
+    Returns (rows, merged_rows, replayed_shard_count).
+    """
+    shards, replayed = resolve(shards)
+    merger = RowMerger()
+    rows, merged, current = [], [], None
+
+    for s in shards:
+        if s["merge_error"]:
+            raise ValueError(s["merge_error"])
+
+        rows.extend(s["rows"])
+
+        _, current = merger.merge_open(s["head"], current)
+        if s["open_case"] is not None:
+            if current:
+                merged.append(current)
+            merged.extend(s["closed"])
+            current = s["open_case"]
+
+    if current:
+        merged.append(current)
+
+    return rows, merged, replayed
+
+
+# ---------- command line ----------
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parse one PDF across several shards")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("plan", help="print start/end page ranges for N shards")
+    p.add_argument("pdf")
+    p.add_argument("--shards", type=int, required=True)
+
+    p = sub.add_parser("parse", help="parse one page range into a shard file")
+    p.add_argument("pdf")
+    p.add_argument("--start", type=int, required=True)
+    p.add_argument("--end", type=int, required=True)
+    p.add_argument("--out", required=True)
+    p.add_argument("--state-in", help="previous shard file whose exit state to start from")
+    p.add_argument("--workers", type=int, default=1)
+
+    p = sub.add_parser("merge", help="stitch shard files in page order")
+    p.add_argument("shards", nargs="+")
+    p.add_argument("--csv", help="write merged rows in the pipeline's CSV layout")
+    p.add_argument("--db", help="replace the date's rows in this SQLite database")
+
+    args = ap.parse_args()
+
+    if args.command == "plan":
+        with PDFSource(args.pdf) as source, source.open() as pdf:
+            page_count = len(pdf.pages)
+        for start, end in plan(page_count, args.shards):
+            print(start, end)
+
+    elif args.command == "parse":
+        entry_state = _load(args.state_in)["exit_state"] if args.state_in else None
+        shard = parse_shard(args.pdf, args.start, args.end, entry_state, args.workers)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(shard, f)
+
+    else:
+        rows, merged, replayed = stitch([_load(path) for path in args.shards])
+        print(f"{len(rows)} rows, {len(merged)} cases, {replayed} shard(s) replayed")
+
+        if args.csv:
+            with open(args.csv, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(HEADERS + METADATA_HEADERS)
+                writer.writerows(merged)
+
+        if args.db and merged:
+            repo = SQLiteCauseListRepository(args.db)
+            repo.prepare_tables(merged[0][7])
+            repo.insert(merged)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,33 +2,128 @@
 
 import sqlite3
 import re
+from collections import Counter
+from case_number import normalize_case_type, parse_case_no, parse_ia_numbers
 
 
 class SQLiteCauseListRepository:
+    AGGREGATE_TABLES = ("judge_daily_counts", "advocate_daily_counts", "bench_daily_counts")
+
     def __init__(self, db_path):
         self.db_path = db_path
+        # judge name -> judge_id and justices string -> _resolve_bench result;
+        # ids are only ever added, so they stay valid for this database
+        self._judge_ids = {}
+        self._benches = {}
+        # dates stored by the baseline pipeline are migrated once per instance
+        self._upgraded = False
 
     def _date_suffix(self, date):
         dd, mm, yyyy = re.split(r"[-/]", date)
         return f"{yyyy}{mm}{dd}"
 
-    def prepare_tables(self, date):
+    def _staging_key(self, suffix):
+        return f"staging_{suffix}"
+
+    def prepare_tables(self, date, cur=None, staging=False):
+        """
+        Create the date's tables and clear its rows. Given a cursor, runs
+        there without committing, like write_batch.
+
+        With staging=True, creates an empty staging copy of the date
+        instead, for write_batch(staging=True) to fill and publish_staged
+        to swap in; the stored list is left untouched until then.
+        """
+        if cur is None:
+            conn = sqlite3.connect(self.db_path)
+            self.prepare_tables(date, conn.cursor(), staging)
+            conn.commit()
+            conn.close()
+            return
+
         suffix = self._date_suffix(date)
+        key = self._staging_key(suffix) if staging else suffix
+        cause = f"cause_list_{key}"
+
+        if staging:
+            # left over by a run that died before publishing or discarding
+            cur.execute(f"DROP TABLE IF EXISTS {cause}")
+        self._create_cause_table(cur, cause)
+        self._create_bench_tables(cur)
+        self._create_case_tables(cur)
+        self._create_aggregate_tables(cur)
+
+        cur.execute("DELETE FROM case_ias WHERE list_date = ?", (key,))
+        cur.execute("DELETE FROM case_numbers WHERE list_date = ?", (key,))
+        self._clear_date_aggregates(cur, key)
+        self._upgrade_legacy_dates(cur)
+        if staging:
+            return
+
+        cur.execute(f"DELETE FROM {cause}")
+        self._drop_legacy_mapping(cur, suffix)
+        self._create_judges_view(cur, suffix)
+
+    def publish_staged(self, date, cur):
+        """
+        Replace the date's stored list, case rows and counts with their
+        staging copies, in the caller's transaction, so readers see either
+        the old list or the new one.
+        """
+        suffix = self._date_suffix(date)
+        key = self._staging_key(suffix)
         cause = f"cause_list_{suffix}"
-        mapping = f"cause_list_judges_{suffix}"
 
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
+        self._clear_date_aggregates(cur, suffix)
+        cur.execute("DELETE FROM case_ias WHERE list_date = ?", (suffix,))
+        cur.execute("DELETE FROM case_numbers WHERE list_date = ?", (suffix,))
+
+        # the view names the table being replaced, which RENAME refuses
+        cur.execute(f"DROP VIEW IF EXISTS cause_judges_{suffix}")
+        self._drop_legacy_mapping(cur, suffix)
+        cur.execute(f"DROP TABLE IF EXISTS {cause}")
+        cur.execute(f"DROP INDEX IF EXISTS idx_cause_list_{key}_bench")
+        cur.execute(f"ALTER TABLE cause_list_{key} RENAME TO {cause}")
+        self._create_cause_table(cur, cause)
+
+        for table in ("case_ias", "case_numbers") + self.AGGREGATE_TABLES:
+            cur.execute(f"UPDATE {table} SET list_date = ? WHERE list_date = ?", (suffix, key))
+        self._create_judges_view(cur, suffix)
+
+    def discard_staged(self, date, cur=None):
+        """Drop the date's staging copy, e.g. after a failed write."""
+        if cur is None:
+            conn = sqlite3.connect(self.db_path)
+            self.discard_staged(date, conn.cursor())
+            conn.commit()
+            conn.close()
+            return
+
+        key = self._staging_key(self._date_suffix(date))
+        cur.execute(f"DROP TABLE IF EXISTS cause_list_{key}")
+        for table in ("case_ias", "case_numbers") + self.AGGREGATE_TABLES:
+            if self._object_type(cur, table):
+                cur.execute(f"DELETE FROM {table} WHERE list_date = ?", (key,))
 
+    def _create_cause_table(self, cur, cause):
         cur.execute(f"""
         CREATE TABLE IF NOT EXISTS {cause} (
             cause_id INTEGER PRIMARY KEY AUTOINCREMENT,
             sno TEXT, case_no TEXT,
             petitioner_respondent TEXT,
-            advocate TEXT, court_no TEXT, page_no TEXT
+            advocate TEXT, court_no TEXT, page_no TEXT,
+            bench_id INTEGER
         )
         """)
+        columns = [r[1] for r in cur.execute(f"PRAGMA table_info({cause})")]
+        if "bench_id" not in columns:
+            cur.execute(f"ALTER TABLE {cause} ADD COLUMN bench_id INTEGER")
+        cur.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_{cause}_bench
+        ON {cause} (bench_id)
+        """)
 
+    def _create_bench_tables(self, cur):
         cur.execute("""
         CREATE TABLE IF NOT EXISTS judges (
             judge_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,57 +131,564 @@ class SQLiteCauseListRepository:
         )
         """)
 
-        cur.execute(f"""
-        CREATE TABLE IF NOT EXISTS {mapping} (
-            cause_id INTEGER,
+        # one row per distinct judge set; bench_key matches bench_daily_counts
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS benches (
+            bench_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            bench_key TEXT UNIQUE
+        )
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS bench_judges (
+            bench_id INTEGER,
             judge_id INTEGER,
-            PRIMARY KEY (cause_id, judge_id)
+            PRIMARY KEY (bench_id, judge_id)
         )
         """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_bench_judges_judge
+        ON bench_judges (judge_id)
+        """)
 
-        cur.execute(f"DELETE FROM {mapping}")
-        cur.execute(f"DELETE FROM {cause}")
+    def _object_type(self, cur, name):
+        cur.execute("SELECT type FROM sqlite_master WHERE name = ?", (name,))
+        found = cur.fetchone()
+        return found[0] if found else None
 
-        conn.commit()
-        conn.close()
+    def _drop_legacy_mapping(self, cur, suffix):
+        # cause_list_judges_<date> is the baseline pipeline's (and the
+        # reference script's) per-case mapping; once the date's rows are
+        # replaced it names cause_ids that no longer exist
+        cur.execute(f"DROP TABLE IF EXISTS cause_list_judges_{suffix}")
+
+    def _create_judges_view(self, cur, suffix):
+        # the per-case mapping, derived from bench_id
+        cur.execute(f"""
+        CREATE VIEW IF NOT EXISTS cause_judges_{suffix} AS
+        SELECT c.cause_id, b.judge_id
+        FROM cause_list_{suffix} c JOIN bench_judges b ON b.bench_id = c.bench_id
+        """)
+
+    def _upgrade_legacy_dates(self, cur):
+        """
+        Fill bench_id for dates whose judges are only in a
+        cause_list_judges_<date> mapping table, as the baseline pipeline
+        and the reference script store them. Runs once per instance.
+        """
+        if self._upgraded:
+            return
+        self._upgraded = True
+
+        mappings = [r[0] for r in cur.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name GLOB 'cause_list_judges_[0-9]*'
+        """).fetchall()]
+
+        for mapping in mappings:
+            suffix = mapping.rsplit("_", 1)[1]
+            cause = f"cause_list_{suffix}"
+            if self._object_type(cur, cause) != "table":
+                continue
+
+            self._create_cause_table(cur, cause)
+            self._create_bench_tables(cur)
+
+            judges = {}
+            for cause_id, judge_id in cur.execute(f"""
+                SELECT m.cause_id, m.judge_id
+                FROM {mapping} m JOIN {cause} c ON c.cause_id = m.cause_id
+                WHERE c.bench_id IS NULL
+            """).fetchall():
+                judges.setdefault(cause_id, set()).add(judge_id)
+            if not judges:
+                continue
+
+            cur.executemany(
+                f"UPDATE {cause} SET bench_id = ? WHERE cause_id = ?",
+                [(self._bench_id(cur, ids)[0], cause_id) for cause_id, ids in judges.items()]
+            )
+            self._create_judges_view(cur, suffix)
+            self._index_stored_date(cur, suffix)
+
+    def _index_stored_date(self, cur, suffix):
+        """Rebuild a stored date's case rows and aggregate counts from its cause rows."""
+        self._create_case_tables(cur)
+        cur.execute("DELETE FROM case_ias WHERE list_date = ?", (suffix,))
+        cur.execute("DELETE FROM case_numbers WHERE list_date = ?", (suffix,))
+
+        for cause_id, case_no, parties in cur.execute(
+            f"SELECT cause_id, case_no, petitioner_respondent FROM cause_list_{suffix}"
+        ).fetchall():
+            self._insert_case_rows(cur, suffix, cause_id, case_no, parties)
+
+        self._create_aggregate_tables(cur)
+        self._clear_date_aggregates(cur, suffix)
+        self._apply_aggregate_deltas(cur, suffix, *self._date_counts(cur, suffix))
+
+    def _read(self):
+        """A connection for the query methods, with legacy dates upgraded first."""
+        conn = sqlite3.connect(self.db_path)
+        if not self._upgraded:
+            try:
+                self._upgrade_legacy_dates(conn.cursor())
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                conn.close()
+                self.forget_ids()
+                raise
+        return conn
 
     def insert(self, rows):
         if not rows:
             return
 
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.write_batch(conn.cursor(), rows)
+            conn.commit()
+        except BaseException:
+            self.forget_ids()
+            raise
+        finally:
+            conn.close()
+
+    def write_batch(self, cur, rows, staging=False):
+        """
+        Insert rows and their aggregate counts through an open cursor,
+        leaving the commit to the caller. With staging=True rows and counts
+        go to the date's staging copy, for publish_staged to swap in.
+        """
         date = rows[0][7]
         suffix = self._date_suffix(date)
-        cause = f"cause_list_{suffix}"
-        mapping = f"cause_list_judges_{suffix}"
+        key = self._staging_key(suffix) if staging else suffix
+        cause = f"cause_list_{key}"
 
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
+        judge_counts = Counter()
+        advocate_counts = Counter()
+        bench_counts = Counter()
 
         for r in rows:
+            bench_id, judge_ids, bench_key = self._resolve_bench(cur, r[4])
+
             cur.execute(
                 f"""
                 INSERT INTO {cause}
-                (sno, case_no, petitioner_respondent, advocate, court_no, page_no)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (sno, case_no, petitioner_respondent, advocate, court_no, page_no, bench_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
-                (r[0], r[1], r[2], r[3], r[5], str(r[8]))
+                (r[0], r[1], r[2], r[3], r[5], str(r[8]), bench_id)
             )
 
-            cause_id = cur.lastrowid
+            self._insert_case_rows(cur, key, cur.lastrowid, r[1], r[2])
 
-            for j in r[4].split("|"):
-                j = j.strip()
-                if not j:
-                    continue
+            court_no = r[5] or ""
+            for judge_id in judge_ids:
+                judge_counts[(judge_id, court_no)] += 1
+            if judge_ids:
+                bench_counts[bench_key] += 1
+            for advocate in self._advocates(r[3]):
+                advocate_counts[advocate] += 1
 
-                cur.execute("INSERT OR IGNORE INTO judges (judge_name) VALUES (?)", (j,))
-                cur.execute("SELECT judge_id FROM judges WHERE judge_name = ?", (j,))
-                judge_id = cur.fetchone()[0]
+        self._create_aggregate_tables(cur)
+        self._apply_aggregate_deltas(
+            cur, key, judge_counts, advocate_counts, bench_counts
+        )
 
-                cur.execute(
-                    f"INSERT OR IGNORE INTO {mapping} VALUES (?, ?)",
-                    (cause_id, judge_id)
+    def _insert_case_rows(self, cur, list_date, cause_id, case_no, parties):
+        parsed = parse_case_no(case_no)
+        if parsed:
+            cur.execute(
+                "INSERT INTO case_numbers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    list_date, cause_id, parsed["case_type"], parsed["number"],
+                    parsed["number_to"], parsed["year"], parsed["section"]
                 )
+            )
+
+        cur.executemany(
+            "INSERT OR IGNORE INTO case_ias VALUES (?, ?, ?, ?)",
+            [(list_date, cause_id, no, year) for no, year in parse_ia_numbers(parties)]
+        )
+
+    # ---------- judges and benches ----------
+
+    def forget_ids(self):
+        """Drop memoized ids, e.g. after rolling back a transaction that assigned them."""
+        self._judge_ids.clear()
+        self._benches.clear()
+        self._upgraded = False
+
+    def _judge_id(self, cur, name):
+        judge_id = self._judge_ids.get(name)
+        if judge_id is None:
+            cur.execute("INSERT OR IGNORE INTO judges (judge_name) VALUES (?)", (name,))
+            cur.execute("SELECT judge_id FROM judges WHERE judge_name = ?", (name,))
+            judge_id = self._judge_ids[name] = cur.fetchone()[0]
+        return judge_id
+
+    def _resolve_bench(self, cur, justices):
+        """
+        (bench_id, judge_ids, bench_key) for a " | "-joined justices string,
+        or (None, set(), None) when it names no judge.
+        """
+        bench = self._benches.get(justices)
+        if bench is not None:
+            return bench
+
+        judge_ids = set()
+        for j in justices.split("|"):
+            j = j.strip()
+            if j:
+                judge_ids.add(self._judge_id(cur, j))
+
+        bench_id = key = None
+        if judge_ids:
+            bench_id, key = self._bench_id(cur, judge_ids)
+
+        bench = self._benches[justices] = (bench_id, judge_ids, key)
+        return bench
+
+    def _bench_id(self, cur, judge_ids):
+        """(bench_id, bench_key) for a non-empty set of judge ids."""
+        key = self._bench_key(judge_ids)
+        cur.execute("INSERT OR IGNORE INTO benches (bench_key) VALUES (?)", (key,))
+        cur.execute("SELECT bench_id FROM benches WHERE bench_key = ?", (key,))
+        bench_id = cur.fetchone()[0]
+        cur.executemany(
+            "INSERT OR IGNORE INTO bench_judges VALUES (?, ?)",
+            [(bench_id, j) for j in judge_ids]
+        )
+        return bench_id, key
+
+    def find_by_judge(self, date, judge_name):
+        """Cases listed before a judge on date, through the bench membership table."""
+        suffix = self._date_suffix(date)
+        cause = f"cause_list_{suffix}"
+
+        conn = self._read()
+        cur = conn.cursor()
+        if not (self._object_type(cur, cause) and self._object_type(cur, "bench_judges")):
+            conn.close()
+            return []
+        rows = cur.execute(
+            f"""
+            SELECT c.*
+            FROM judges j
+            JOIN bench_judges b ON b.judge_id = j.judge_id
+            JOIN {cause} c ON c.bench_id = b.bench_id
+            WHERE j.judge_name = ?
+            ORDER BY c.cause_id
+            """,
+            (judge_name,)
+        ).fetchall()
+        conn.close()
+        return rows
+
+    # ---------- workload aggregates ----------
 
-        conn.commit()
+    def _bench_key(self, judge_ids):
+        return ",".join(str(j) for j in sorted(judge_ids))
+
+    def _advocates(self, text):
+        # RowMerger joins the petitioner and respondent advocate lines with
+        # a space, so a [P-1] / [R-2] marker ends a name just like a comma.
+        # Single letters are wrapped-line debris ("[R-14], a [R-15.2]")
+        if not text:
+            return []
+        parts = re.split(r",|\[[^\]]*\]", text)
+        names = (" ".join(part.split()) for part in parts)
+        return sorted({n for n in names if len(n) > 1})
+
+    def _create_aggregate_tables(self, cur):
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS judge_daily_counts (
+            judge_id INTEGER, list_date TEXT, court_no TEXT,
+            case_count INTEGER NOT NULL,
+            PRIMARY KEY (judge_id, list_date, court_no)
+        )
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS advocate_daily_counts (
+            advocate TEXT, list_date TEXT,
+            case_count INTEGER NOT NULL,
+            PRIMARY KEY (advocate, list_date)
+        )
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS bench_daily_counts (
+            bench_key TEXT, list_date TEXT,
+            case_count INTEGER NOT NULL,
+            PRIMARY KEY (bench_key, list_date)
+        )
+        """)
+        # the primary keys lead with judge/advocate/bench, so date filters
+        # and the per-date cleanup need their own index
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_judge_daily_counts_date
+        ON judge_daily_counts (list_date, court_no)
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_advocate_daily_counts_date
+        ON advocate_daily_counts (list_date)
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_bench_daily_counts_date
+        ON bench_daily_counts (list_date)
+        """)
+
+    def _apply_aggregate_deltas(self, cur, suffix, judge_counts, advocate_counts,
+                                bench_counts):
+        cur.executemany(
+            """
+            INSERT INTO judge_daily_counts VALUES (?, ?, ?, ?)
+            ON CONFLICT (judge_id, list_date, court_no)
+            DO UPDATE SET case_count = case_count + excluded.case_count
+            """,
+            [(j, suffix, c, n) for (j, c), n in judge_counts.items()]
+        )
+        cur.executemany(
+            """
+            INSERT INTO advocate_daily_counts VALUES (?, ?, ?)
+            ON CONFLICT (advocate, list_date)
+            DO UPDATE SET case_count = case_count + excluded.case_count
+            """,
+            [(a, suffix, n) for a, n in advocate_counts.items()]
+        )
+        cur.executemany(
+            """
+            INSERT INTO bench_daily_counts VALUES (?, ?, ?)
+            ON CONFLICT (bench_key, list_date)
+            DO UPDATE SET case_count = case_count + excluded.case_count
+            """,
+            [(b, suffix, n) for b, n in bench_counts.items()]
+        )
+
+    def _date_counts(self, cur, suffix):
+        """(judge_counts, advocate_counts, bench_counts) of a stored date's rows."""
+        cause = f"cause_list_{suffix}"
+        mapping = f"cause_judges_{suffix}"
+
+        judge_counts = Counter()
+        bench_judges = {}
+        for cause_id, judge_id, court_no in cur.execute(f"""
+            SELECT m.cause_id, m.judge_id, c.court_no
+            FROM {mapping} m JOIN {cause} c ON c.cause_id = m.cause_id
+        """):
+            judge_counts[(judge_id, court_no or "")] += 1
+            bench_judges.setdefault(cause_id, set()).add(judge_id)
+
+        bench_counts = Counter(self._bench_key(ids) for ids in bench_judges.values())
+
+        advocate_counts = Counter()
+        for (advocate,) in cur.execute(f"SELECT advocate FROM {cause}").fetchall():
+            advocate_counts.update(self._advocates(advocate))
+
+        return judge_counts, advocate_counts, bench_counts
+
+    def _clear_date_aggregates(self, cur, suffix):
+        # every count of a date comes from that date's list alone, so
+        # replacing the list deletes them and the new rows' deltas rebuild
+        # them; subtracting a recount of the stored rows would go wrong once
+        # the reference script had cleared those rows behind our back
+        for table in self.AGGREGATE_TABLES:
+            cur.execute(f"DELETE FROM {table} WHERE list_date = ?", (suffix,))
+
+    def judge_workload(self, date=None, court_no=None):
+        clauses, params = ["a.list_date NOT GLOB 'staging_*'"], []
+        if date is not None:
+            clauses.append("a.list_date = ?")
+            params.append(self._date_suffix(date))
+        if court_no is not None:
+            clauses.append("a.court_no = ?")
+            params.append(str(court_no))
+
+        where = f"WHERE {' AND '.join(clauses)}"
+
+        conn = self._read()
+        cur = conn.cursor()
+        if not self._object_type(cur, "judge_daily_counts"):
+            conn.close()
+            return []
+        rows = cur.execute(
+            f"""
+            SELECT j.judge_name, a.list_date, a.court_no, a.case_count
+            FROM judge_daily_counts a JOIN judges j ON j.judge_id = a.judge_id
+            {where}
+            ORDER BY a.list_date, a.court_no, j.judge_name
+            """,
+            params
+        ).fetchall()
+        conn.close()
+        return rows
+
+    def advocate_workload(self, date=None, advocate=None):
+        clauses, params = ["list_date NOT GLOB 'staging_*'"], []
+        if date is not None:
+            clauses.append("list_date = ?")
+            params.append(self._date_suffix(date))
+        if advocate is not None:
+            clauses.append("advocate = ?")
+            params.append(advocate)
+
+        where = f"WHERE {' AND '.join(clauses)}"
+
+        conn = self._read()
+        cur = conn.cursor()
+        if not self._object_type(cur, "advocate_daily_counts"):
+            conn.close()
+            return []
+        rows = cur.execute(
+            f"""
+            SELECT advocate, list_date, case_count
+            FROM advocate_daily_counts
+            {where}
+            ORDER BY list_date, case_count DESC, advocate
+            """,
+            params
+        ).fetchall()
         conn.close()
+        return rows
+
+    def bench_workload(self, date=None):
+        where, params = "WHERE list_date NOT GLOB 'staging_*'", []
+        if date is not None:
+            where, params = "WHERE list_date = ?", [self._date_suffix(date)]
+
+        conn = self._read()
+        cur = conn.cursor()
+        if not self._object_type(cur, "bench_daily_counts"):
+            conn.close()
+            return []
+        counts = cur.execute(
+            f"""
+            SELECT bench_key, list_date, case_count
+            FROM bench_daily_counts
+            {where}
+            ORDER BY list_date, case_count DESC
+            """,
+            params
+        ).fetchall()
+        names = dict(cur.execute("SELECT judge_id, judge_name FROM judges"))
+        conn.close()
+
+        return [
+            (
+                " | ".join(names[int(j)] for j in key.split(",")),
+                list_date,
+                case_count
+            )
+            for key, list_date, case_count in counts
+        ]
+
+    # ---------- structured case-number queries ----------
+
+    def _create_case_tables(self, cur):
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS case_numbers (
+            list_date TEXT, cause_id INTEGER,
+            case_type TEXT, number INTEGER, number_to INTEGER,
+            year INTEGER, section TEXT,
+            PRIMARY KEY (list_date, cause_id)
+        )
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_case_numbers_type_year
+        ON case_numbers (case_type, year, number)
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_case_numbers_year
+        ON case_numbers (year, number)
+        """)
+
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS case_ias (
+            list_date TEXT, cause_id INTEGER,
+            ia_no INTEGER, ia_year INTEGER,
+            PRIMARY KEY (list_date, cause_id, ia_no, ia_year)
+        )
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_case_ias_ia
+        ON case_ias (ia_no, ia_year)
+        """)
+
+
+    def _find_joined(self, index, columns, where, params, order, date):
+        """
+        Rows of the cause tables joined to a global index table, as
+        c.* + columns + (list_date,), one cause table per matching date.
+        """
+        if date is not None:
+            where.append("x.list_date = ?")
+            params.append(self._date_suffix(date))
+        else:
+            # rows of a list still being written, see publish_staged
+            where.append("x.list_date NOT GLOB 'staging_*'")
+        where = " AND ".join(where) if where else "1"
+
+        conn = self._read()
+        cur = conn.cursor()
+        if not self._object_type(cur, index):
+            conn.close()
+            return []
+        dates = [r[0] for r in cur.execute(
+            f"SELECT DISTINCT x.list_date FROM {index} x WHERE {where} ORDER BY x.list_date",
+            params
+        ).fetchall()]
+
+        rows = []
+        for suffix in dates:
+            rows.extend(cur.execute(
+                f"""
+                SELECT c.*, {columns}, x.list_date
+                FROM {index} x
+                JOIN cause_list_{suffix} c ON c.cause_id = x.cause_id
+                WHERE {where} AND x.list_date = ?
+                ORDER BY {order}
+                """,
+                params + [suffix]
+            ).fetchall())
+        conn.close()
+        return rows
+
+    def find_cases(self, date=None, case_type=None, year=None, number_from=None, number_to=None):
+        """
+        Cases by structured case number, on date or across every stored
+        date. case_type is normalized like the stored values, so "T.P.(Crl)",
+        "TP(CRL)" and "Transfer Petition (Criminal)" all match.
+        """
+        clauses, params = [], []
+        if case_type is not None:
+            clauses.append("x.case_type = ?")
+            params.append(normalize_case_type(case_type))
+        if year is not None:
+            clauses.append("x.year = ?")
+            params.append(year)
+        if number_from is not None:
+            clauses.append("x.number >= ?")
+            params.append(number_from)
+        if number_to is not None:
+            clauses.append("x.number <= ?")
+            params.append(number_to)
+
+        return self._find_joined(
+            "case_numbers",
+            "x.case_type, x.number, x.number_to, x.year, x.section",
+            clauses, params, "x.case_type, x.year, x.number", date
+        )
+
+    def find_by_ia(self, date=None, ia_from=None, ia_to=None, ia_year=None):
+        """Cases mentioning an I.A. number in a range, on date or across every stored date."""
+        if ia_from is None:
+            raise ValueError("find_by_ia needs ia_from")
+
+        clauses = ["x.ia_no BETWEEN ? AND ?"]
+        params = [ia_from, ia_from if ia_to is None else ia_to]
+        if ia_year is not None:
+            clauses.append("x.ia_year = ?")
+            params.append(ia_year)
+
+        return self._find_joined(
+            "case_ias", "x.ia_no, x.ia_year", clauses, params, "x.ia_no", date
+        )
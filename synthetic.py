@@ -0,0 +1,247 @@
+# synthetic.py
+
+import random
+
+
+PAGE_WIDTH = 595.28
+PAGE_BOTTOM = 765.0
+LINE_HEIGHT = 8.9
+LINE_GAP = 10.6
+CASE_GAP = 20.6
+CHAR_WIDTH = 5.2
+SIGNATURE_GAP = 13.5
+SIGNATURE_HEIGHT = 3 * SIGNATURE_GAP
+SPACE_WIDTH = 2.9
+
+# x0 of each column's text and the gray header cell behind it, taken from
+# the 2025 template (cause_list20251230.pdf)
+COLUMN_X = [43.4, 68.9, 184.9, 426.1]
+HEADER_CELLS = [(42.52, 68.032), (68.032, 170.08), (170.08, 425.2), (425.2, 552.76)]
+HEADER_GRAY = (0.8, 0.8, 0.8)
+MARGIN_X = 42.5
+SECTION_X = 162.1
+
+JUSTICES = [
+    "JOYMALYA BAGCHI", "K. VINOD CHANDRAN", "MANMOHAN", "VIJAY BISHNOI",
+    "SANJAY KAROL", "PRASHANT KUMAR MISHRA", "SATISH CHANDRA SHARMA",
+    "AUGUSTINE GEORGE MASIH", "SANDEEP MEHTA", "ARAVIND KUMAR",
+]
+PARTIES = [
+    "STATE OF KERALA", "UNION OF INDIA", "THE STATE OF BIHAR", "RAM KISHAN @ BALA",
+    "KAMAKHYA SINGH AND ANR.", "IDBI BANK LIMITED", "STATE OF U.P AND ORS.",
+    "BATHINDA DEVELOPMENT AUTHORITY", "THE STATE OF GOA AND ORS.", "P.I. ISSAC,",
+]
+ADVOCATES = [
+    "ANNE MATHEW", "SMARHAR SINGH", "PALLAVI SINGH", "EKANSH BANSAL",
+    "SOMANATHA PADHAN", "VISHNU SHARMA A.S.", "SAMAR VIJAY SINGH", "BAANI KHANNA",
+]
+SECTIONS = ["II", "II-A", "II-B", "II-C", "II-D", "III", "IV-A", "IX", "XI-A", "XVII-A"]
+IA_TEXT = [
+    "EXEMPTION FROM FILING O.T.", "CONDONATION OF DELAY IN REFILING / CURING THE DEFECTS",
+    "EXEMPTION FROM SURRENDERING WITHIN TIME", "PERMISSION TO FILE ADDITIONAL DOCUMENTS",
+    "STAY APPLICATION",
+]
+LISTING_TITLES = [
+    "[FRESH (FOR ADMISSION) - CRIMINAL CASES]", "[DIRECTION MATTERS]",
+    "[ORDERS (INCOMPLETE MATTERS / IAs / CRLMPs)]", "[DEFAULT / OTHER MATTERS]",
+]
+
+
+class _PageBuilder:
+    def __init__(self, top):
+        self.words = []
+        self.rects = []
+        self.top = top
+
+    def fits(self, gap):
+        return self.top + gap + LINE_HEIGHT <= PAGE_BOTTOM
+
+    def text(self, x0, text):
+        x = x0
+        for token in text.split():
+            x1 = x + len(token) * CHAR_WIDTH
+            self.words.append({
+                "text": token,
+                "x0": round(x, 3),
+                "x1": round(x1, 3),
+                "top": round(self.top, 3),
+                "bottom": round(self.top + LINE_HEIGHT, 3),
+            })
+            x = x1 + SPACE_WIDTH
+
+    def line(self, gap, cells):
+        self.top += gap
+        for x0, text in cells:
+            if text:
+                self.text(x0, text)
+
+    def page(self):
+        return {"width": PAGE_WIDTH, "words": self.words, "rects": self.rects}
+
+
+class SyntheticCauseList:
+    """
+    Seeded stream of synthetic cause-list pages in the shape of
+    pdf_parser.extract_page output, for benchmarking every stage after
+    PDF decoding.
+
+    Each court gets a title page with date, COURT NO and HON'BLE lines and
+    a gray two-row header, then multi-line cases with listing titles,
+    decimal SNO continuations and cases split across pages, closed by a
+    NEW DELHI signature block. Blank and notice pages are mixed in.
+    """
+
+    def __init__(self, pages=1000, seed=0, date="05-01-2026",
+                 pages_per_court=(4, 24), blank_rate=0.05, notice_rate=0.02):
+        self.pages = pages
+        self.seed = seed
+        self.date = date
+        self.pages_per_court = pages_per_court
+        self.blank_rate = blank_rate
+        self.notice_rate = notice_rate
+
+    def __len__(self):
+        return self.pages
+
+    def __iter__(self):
+        rng = random.Random(self.seed)
+        emitted = 0
+        court_no = 0
+
+        while emitted < self.pages:
+            court_no += 1
+            budget = min(rng.randint(*self.pages_per_court), self.pages - emitted)
+
+            for page in self._court(rng, court_no, budget):
+                yield page
+                emitted += 1
+
+            while emitted < self.pages and rng.random() < self.blank_rate:
+                yield {"width": PAGE_WIDTH, "words": [], "rects": []}
+                emitted += 1
+
+            if emitted < self.pages and rng.random() < self.notice_rate:
+                yield self._notice_page(rng)
+                emitted += 1
+
+    # ---------- page sections ----------
+
+    def _notice_page(self, rng):
+        page = _PageBuilder(100.0)
+        for _ in range(rng.randint(5, 20)):
+            page.line(LINE_GAP, [(MARGIN_X, "ADVANCE LIST NOTICE FOR MATTERS LISTED BELOW")])
+        return page.page()
+
+    def _title_page(self, rng, court_no):
+        page = _PageBuilder(108.4)
+        page.text(232.7, "SUPREME COURT OF INDIA")
+        page.line(13.5, [(161.2, "[ IT WILL BE APPRECIATED IF THE LEARNED ADVOCATES")])
+        page.line(13.5, [(153.7, "ON RECORD DO NOT SEEK ADJOURNMENT IN THE MATTERS")])
+        page.line(13.5, [(166.0, "LISTED BEFORE ALL THE COURTS IN THE CAUSE LIST ]")])
+        page.line(13.0, [(196.4, f"DAILY CAUSE LIST FOR DATED : {self.date}")])
+        page.line(LINE_GAP, [(261.5, f"COURT NO. : {court_no}")])
+
+        for justice in rng.sample(JUSTICES, rng.randint(1, 3)):
+            page.line(12.5, [(199.2, f"HON'BLE MR. JUSTICE {justice}")])
+
+        page.line(15.0, [(249.4, "CHAMBER MATTERS")])
+
+        header_top = page.top + 10.0
+        for x0, x1 in HEADER_CELLS:
+            page.rects.append({
+                "x0": x0, "x1": x1,
+                "top": header_top, "bottom": header_top + 23.0,
+                "non_stroking_color": HEADER_GRAY,
+            })
+        page.line(12.3, [(COLUMN_X[3], "Petitioner/Respondent")])
+        page.line(5.4, [
+            (COLUMN_X[0], "SNo."), (COLUMN_X[1], "Case No."),
+            (COLUMN_X[2], "Petitioner / Respondent"),
+        ])
+        page.line(5.3, [(COLUMN_X[3], "Advocate")])
+
+        page.line(23.1, [(SECTION_X, rng.choice(LISTING_TITLES))])
+        return page
+
+    def _continuation_page(self, court_no):
+        page = _PageBuilder(47.9)
+        page.text(196.4, f"DAILY CAUSE LIST FOR DATED : {self.date}")
+        page.line(LINE_GAP, [(261.5, f"COURT NO. : {court_no}")])
+        return page
+
+    def _case_number(self, rng):
+        year = rng.randint(2009, 2025)
+        n = rng.randint(100, 75000)
+        kind = rng.randrange(5)
+        if kind == 0:
+            return f"Diary No. {n}-{year}"
+        if kind == 1:
+            return f"SLP(C) No. {n}/{year}"
+        if kind == 2:
+            return f"SLP(Crl) No. {n}/{year}"
+        if kind == 3:
+            return f"C.A. No. {n}-{n + rng.randint(1, 5)}/{year}"
+        return f"T.P.(C) No. {n}/{year}"
+
+    def _case_lines(self, rng, sno):
+        ia_year = rng.randint(2016, 2025)
+        lines = [
+            (CASE_GAP, [
+                (COLUMN_X[0], str(sno)), (COLUMN_X[1], self._case_number(rng)),
+                (COLUMN_X[2], rng.choice(PARTIES)), (COLUMN_X[3], rng.choice(ADVOCATES)),
+            ]),
+            (LINE_GAP, [(COLUMN_X[1], rng.choice(SECTIONS))]),
+            (12.4, [(COLUMN_X[2], "Versus")]),
+            (12.4, [(COLUMN_X[2], rng.choice(PARTIES)), (COLUMN_X[3], rng.choice(ADVOCATES))]),
+        ]
+
+        for _ in range(rng.randint(0, 4)):
+            ia = f"IA No. {rng.randint(1000, 340000)}/{ia_year} - {rng.choice(IA_TEXT)}"
+            lines.append((12.4, [(COLUMN_X[2], ia[:48])]))
+            if len(ia) > 48:
+                lines.append((LINE_GAP, [(COLUMN_X[2], ia[48:])]))
+
+        # connected matters print their SNO wrapped, e.g. "1714" then ".2"
+        connected = rng.choice([1, 2, 4]) if rng.random() < 0.2 else 0
+        for k in range(1, connected + 1):
+            lines.append((CASE_GAP, [
+                (COLUMN_X[0], str(sno)), (COLUMN_X[1], "Connected"),
+                (COLUMN_X[2], rng.choice(PARTIES)), (COLUMN_X[3], rng.choice(ADVOCATES)),
+            ]))
+            lines.append((LINE_GAP, [(COLUMN_X[0], f".{k}"), (COLUMN_X[1], "MA 294/2025 in C.A.")]))
+            lines.append((LINE_GAP, [(COLUMN_X[1], f"No. {rng.randint(100, 9999)}/{ia_year}")]))
+
+        return lines
+
+    def _court(self, rng, court_no, budget):
+        page = self._title_page(rng, court_no)
+        produced = 1
+        sno = 1701
+
+        while True:
+            # a listing title before the court's first case would merge
+            # into the previous court's last case
+            if sno > 1701 and rng.random() < 0.05:
+                lines = [(CASE_GAP, [(SECTION_X, rng.choice(LISTING_TITLES))])]
+            else:
+                lines = self._case_lines(rng, sno)
+                sno += 1
+
+            for gap, cells in lines:
+                # the court's last page keeps room for the signature block
+                reserve = SIGNATURE_HEIGHT if produced >= budget else 0
+                if not page.fits(gap + reserve):
+                    if produced >= budget:
+                        yield self._close_court(page)
+                        return
+                    yield page.page()
+                    page = self._continuation_page(court_no)
+                    produced += 1
+                    gap = LINE_GAP
+                page.line(gap, cells)
+
+    def _close_court(self, page):
+        page.line(SIGNATURE_GAP, [(MARGIN_X, "NEW DELHI")])
+        page.line(SIGNATURE_GAP, [(MARGIN_X, f"{self.date} 17:14:17")])
+        page.line(SIGNATURE_GAP, [(426.6, "ADDITIONAL REGISTRAR")])
+        return page.page()
@@ -0,0 +1,81 @@
+# test_case_number.py
+
+import pytest
+
+from case_number import normalize_case_type, parse_case_no, parse_ia_numbers
+
+
+# cells as printed in the 2025 cause list
+CASES_2025 = [
+    ("Diary No. 63258-2025 II-D", ("DIARY", 63258, None, 2025, "II-D")),
+    ("T.P.(C) No. 1086/2024 XVI", ("TP(C)", 1086, None, 2024, "XVI")),
+    ("SLP(Crl) No. 6232/2024 II-A", ("SLP(CRL)", 6232, None, 2024, "II-A")),
+    ("MA 1121/2024 in C.A. No. 4196/2023 XVII-A", ("MA", 1121, None, 2024, "XVII-A")),
+    ("Connected No. 4196/2023 XVII-A", (None, 4196, None, 2023, "XVII-A")),
+    ("C.A. No. 5973/2009 III", ("CA", 5973, None, 2009, "III")),
+    ("SLP(C) No. 13836-13842/2024 II-A", ("SLP(C)", 13836, 13842, 2024, "II-A")),
+    ("Civil Appeal No. 12/2020", ("CA", 12, None, 2020, None)),
+]
+
+# cells as printed in the 2017 cause list, with its "No.-" forms
+CASES_2017 = [
+    ("No.-20699-20700/2017 XII Connected", (None, 20699, 20700, 2017, "XII")),
+    ("SLP(C) No.-21169-21170/2017 XII [ORDERS", ("SLP(C)", 21169, 21170, 2017, "XII")),
+    ("W.P.(C) No.-338/2006 X", ("WP(C)", 338, None, 2006, "X")),
+    ("MA-707-/2017 XI", ("MA", 707, None, 2017, "XI")),
+    ("MA-102-103/2017 XI -A Connected", ("MA", 102, 103, 2017, "XI-A")),
+    ("Diary No. 28784-2017 XII SLP(C) No.-24807-", ("DIARY", 28784, None, 2017, "XII")),
+    ("W.P.(Crl.) No.-53/2015 X", ("WP(CRL)", 53, None, 2015, "X")),
+    ("S.L.P.(C)...CC No.-1944/2017 XVI -A", ("SLP(C)CC", 1944, None, 2017, "XVI-A")),
+    ("CONMT.PET.(C) No.-635-636/2015 XIV [ORDERS", ("CONMTPET(C)", 635, 636, 2015, "XIV")),
+    ("SLP(Crl) No.-6612- /2017 II-C [AFTER", ("SLP(CRL)", 6612, None, 2017, "II-C")),
+    ("T.P.(Crl.) No.-319-/2017 XVI -A", ("TP(CRL)", 319, None, 2017, "XVI-A")),
+    ("SLP(Crl.)...CRLMP No.-6898/2011 II-A", ("SLP(CRL)CRLMP", 6898, None, 2011, "II-A")),
+    ("T.C.(C) No.-87/2013 XVI -A Connected", ("TC(C)", 87, None, 2013, "XVI-A")),
+]
+
+
+@pytest.mark.parametrize("text, expected", CASES_2025 + CASES_2017)
+def test_parse_case_no(text, expected):
+    parsed = parse_case_no(text)
+    assert (
+        parsed["case_type"], parsed["number"], parsed["number_to"],
+        parsed["year"], parsed["section"]
+    ) == expected
+
+
+@pytest.mark.parametrize("text", ["", None, "Connected"])
+def test_parse_case_no_without_number(text):
+    assert parse_case_no(text) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("SLP(Crl.)", "SLP(CRL)"),
+    ("SLP(Crl)", "SLP(CRL)"),
+    ("slp (crl)", "SLP(CRL)"),
+    ("T.P.(Crl)", "TP(CRL)"),
+    ("TP(CRL)", "TP(CRL)"),
+    ("Transfer Petition (Criminal)", "TP(CRL)"),
+    ("C.A.", "CA"),
+    ("CA", "CA"),
+    ("Civil Appeal", "CA"),
+    ("Special Leave Petition (Civil)", "SLP(C)"),
+    ("W.P.(C)", "WP(C)"),
+    ("CONMT.PET.(C)", "CONMTPET(C)"),
+    ("Connected", None),
+    ("", None),
+])
+def test_normalize_case_type(text, expected):
+    assert normalize_case_type(text) == expected
+
+
+def test_stored_and_queried_types_agree():
+    # find_cases normalizes its argument with the same function
+    for text, (case_type, *_) in CASES_2025 + CASES_2017:
+        if case_type and case_type != "DIARY":
+            assert normalize_case_type(case_type) == case_type
+
+
+def test_parse_ia_numbers():
+    text = "X Versus Y IA No. 37698/2024 - SUBSTITUTION IA No. 286668/2025 - DELAY"
+    assert parse_ia_numbers(text) == [(37698, 2024), (286668, 2025)]
@@ -0,0 +1,72 @@
+# test_csv_importer.py
+
+import csv
+import sqlite3
+
+import pytest
+
+from csv_importer import COLUMNS, CSVImporter
+
+
+BENCH = "HON'BLE MR. JUSTICE A | HON'BLE MR. JUSTICE B"
+
+
+def write_csv(path, date, count, first=1):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(COLUMNS)
+        for sno in range(first, first + count):
+            w.writerow([
+                str(sno), f"C.A. No. {sno}/2020 III", "X Versus Y", "PAL [P-1]",
+                BENCH, "2", "COURT", date, "1",
+            ])
+    return str(path)
+
+
+def stored(db_path, suffix):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            f"SELECT sno FROM cause_list_{suffix} ORDER BY cause_id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def test_rows_keep_file_order(tmp_path):
+    db = str(tmp_path / "cause_list.db")
+    paths = [
+        write_csv(tmp_path / "a.csv", "05-01-2026", 7),
+        write_csv(tmp_path / "b.csv", "06-01-2026", 5, first=100),
+    ]
+    stats = CSVImporter(db, workers=2, chunk_size=2, read_ahead=1).run(paths)
+
+    assert stats["rows"] == 12
+    assert stats["dates"] == ["05-01-2026", "06-01-2026"]
+    assert stored(db, "20260105") == [(str(n),) for n in range(1, 8)]
+    assert stored(db, "20260106") == [(str(n),) for n in range(100, 105)]
+
+
+def test_repeated_date_leaves_database_unchanged(tmp_path):
+    db = str(tmp_path / "cause_list.db")
+    CSVImporter(db).run([write_csv(tmp_path / "old.csv", "05-01-2026", 3)])
+    before = stored(db, "20260105")
+
+    paths = [
+        write_csv(tmp_path / "a.csv", "05-01-2026", 6),
+        write_csv(tmp_path / "b.csv", "06-01-2026", 4),
+        write_csv(tmp_path / "c.csv", "05-01-2026", 2),
+    ]
+    with pytest.raises(ValueError, match="also in"):
+        CSVImporter(db, workers=2, chunk_size=2).run(paths)
+
+    assert stored(db, "20260105") == before
+    with pytest.raises(sqlite3.OperationalError):
+        stored(db, "20260106")
+
+
+def test_same_file_twice_is_a_repeated_date(tmp_path):
+    db = str(tmp_path / "cause_list.db")
+    path = write_csv(tmp_path / "a.csv", "05-01-2026", 3)
+    with pytest.raises(ValueError, match="also in"):
+        CSVImporter(db).run([path, path])
@@ -0,0 +1,32 @@
+# test_layout_cache.py
+
+from layout_cache import LayoutTemplateStore
+
+
+WORDS = [[
+    {"text": "SNo.", "x0": 30.04, "top": 100.0},
+    {"text": "Case No.", "x0": 70.31, "top": 100.0},
+    {"text": "Petitioner /", "x0": 180.0, "top": 100.0},
+    {"text": "Respondent", "x0": 180.0, "top": 110.0},
+]]
+COLUMNS = [{"name": "SNO.", "x0": 30.04, "x1": 68.31}, {"name": "CASE NO.", "x0": 70.31, "x1": 560.0}]
+
+
+def test_fingerprint_ignores_sub_rounding_shifts():
+    store = LayoutTemplateStore()
+    shifted = [[dict(w, x0=w["x0"] + 0.003) for w in WORDS[0]]]
+    assert store.fingerprint(WORDS, 595.0) == store.fingerprint(shifted, 595.02)
+    assert store.fingerprint(WORDS, 595.0) != store.fingerprint(WORDS, 842.0)
+
+
+def test_templates_survive_save_and_load(tmp_path):
+    path = str(tmp_path / "layout_templates.json")
+    store = LayoutTemplateStore(path)
+    key = store.fingerprint(WORDS, 595.0)
+    assert store.get(key) is None
+    store.put(key, COLUMNS)
+    store.save()
+
+    loaded = LayoutTemplateStore(path)
+    assert loaded.get(loaded.fingerprint(WORDS, 595.0)) == COLUMNS
+    assert loaded.stats() == {"templates": 1, "hits": 1, "misses": 0}
@@ -0,0 +1,54 @@
+# test_pdf_parser.py
+
+import pytest
+
+from pdf_parser import PDFTableParser
+
+
+BENCH = "HON'BLE MR. JUSTICE J.K. MAHESHWARI | HON'BLE MR. JUSTICE VIJAY BISHNOI"
+
+
+@pytest.mark.parametrize("name, selected", [
+    ("J.K. MAHESHWARI", True),
+    ("J. K. MAHESHWARI", True),
+    ("JK MAHESHWARI", True),
+    ("j.k. maheshwari", True),
+    ("HON'BLE MR. JUSTICE J.K. MAHESHWARI", True),
+    ("MAHESHWARI", True),
+    ("MAHESH", False),
+    ("J.K. MAHESH", False),
+    ("K. MAHESHWARI VIJAY", False),
+    ("VIJAY BISHNOI", True),
+])
+def test_judge_selection(name, selected):
+    parser = PDFTableParser(judges=[name])
+    assert parser.section_selected("3", BENCH) is selected
+
+
+@pytest.mark.parametrize("court, court_no, selected", [
+    ("1", "01", True),
+    ("01", "1", True),
+    (" 1 ", "1", True),
+    ("1", "11", False),
+    ("1", "10", False),
+    ("RC1", "rc1", True),
+    ("1", None, False),
+])
+def test_court_selection(court, court_no, selected):
+    parser = PDFTableParser(courts=[court])
+    assert parser.section_selected(court_no, BENCH) is selected
+
+
+def test_court_key():
+    parser = PDFTableParser()
+    assert parser._court_key("01") == parser._court_key(1) == 1
+    assert parser._court_key(" rc1 ") == "RC1"
+
+
+def test_names_match_whole_words_only():
+    parser = PDFTableParser()
+    line = parser._name_tokens("HON'BLE MR. JUSTICE J. K. MAHESHWARI")
+    assert parser._names_match(parser._name_tokens("JK"), line)
+    assert parser._names_match(parser._name_tokens("J.K."), line)
+    assert not parser._names_match(parser._name_tokens("MAHESH"), line)
+    assert not parser._names_match(parser._name_tokens("KMAHESH"), line)
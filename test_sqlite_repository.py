@@ -0,0 +1,110 @@
+# test_sqlite_repository.py
+
+import pytest
+
+from sqlite_repository import SQLiteCauseListRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return SQLiteCauseListRepository(str(tmp_path / "cause_list.db"))
+
+
+# advocate cells from the 05-01-2026 export
+@pytest.mark.parametrize("text, expected", [
+    ("ANNE MATHEW", ["ANNE MATHEW"]),
+    ("A. KARTHIK [P-1]", ["A. KARTHIK"]),
+    (
+        "SHUBHAM BHALLA [P-1] BAANI KHANNA [R-2]",
+        ["BAANI KHANNA", "SHUBHAM BHALLA"],
+    ),
+    (
+        "ARVIND GUPTA [P-1] SAMAR VIJAY SINGH [R-1], [R-2], [R-3]",
+        ["ARVIND GUPTA", "SAMAR VIJAY SINGH"],
+    ),
+    (
+        "SHUBHAM BHALLA [P-1] SUBHASISH BHOWMICK [R-1], BAANI KHANNA [R-5]",
+        ["BAANI KHANNA", "SHUBHAM BHALLA", "SUBHASISH BHOWMICK"],
+    ),
+    (
+        "VIPIN KUMAR [P-1], [P-2] D. ABHINAV RAO [CAVEAT], [R-1.5], [R-1.4]",
+        ["D. ABHINAV RAO", "VIPIN KUMAR"],
+    ),
+    (
+        "AJAY MARWAH [R-1.1], [R-5], [R-14], a [R-15.2], [R-17.1]",
+        ["AJAY MARWAH"],
+    ),
+    (
+        "PRITHVI PAL SUDHANSU PALO [R-1], [R-2], V. MAHESHWARI & CO. [R-6], [R-6]",
+        ["PRITHVI PAL SUDHANSU PALO", "V. MAHESHWARI & CO."],
+    ),
+    ("", []),
+    (None, []),
+])
+def test_advocates(repo, text, expected):
+    assert repo._advocates(text) == expected
+
+
+DATE = "05-01-2026"
+BENCH = "HON'BLE MR. JUSTICE A | HON'BLE MR. JUSTICE B"
+ROWS = [
+    ["1", "SLP(C) No. 1/2025 II", "X Versus Y IA No. 5/2025", "PAL [P-1] QURESHI [R-1]", BENCH, "2", "COURT", DATE, 1],
+    ["2", "C.A. No. 7/2020 III", "Z Versus W", "PAL [P-1]", BENCH, "2", "COURT", DATE, 1],
+]
+
+
+def test_staged_counts_appear_only_when_published(repo):
+    import sqlite3
+
+    repo.prepare_tables(DATE)
+    repo.insert(ROWS[:1])
+    before = repo.judge_workload()
+
+    conn = sqlite3.connect(repo.db_path)
+    cur = conn.cursor()
+    repo.prepare_tables(DATE, cur, staging=True)
+    repo.write_batch(cur, ROWS, staging=True)
+    conn.commit()
+    assert repo.judge_workload() == before
+    assert repo.advocate_workload(DATE) == [("PAL", "20260105", 1), ("QURESHI", "20260105", 1)]
+
+    repo.publish_staged(DATE, cur)
+    conn.commit()
+    conn.close()
+    assert [r[3] for r in repo.judge_workload(DATE)] == [2, 2]
+    assert repo.advocate_workload(DATE) == [("PAL", "20260105", 2), ("QURESHI", "20260105", 1)]
+    assert len(repo.find_cases(case_type="CA")) == 1
+
+
+def test_baseline_dates_are_migrated_on_first_read(repo):
+    import sqlite3
+
+    # the baseline pipeline's layout: judges only in the mapping table
+    conn = sqlite3.connect(repo.db_path)
+    conn.executescript("""
+        CREATE TABLE cause_list_20260105 (
+            cause_id INTEGER PRIMARY KEY AUTOINCREMENT, sno TEXT, case_no TEXT,
+            petitioner_respondent TEXT, advocate TEXT, court_no TEXT, page_no TEXT
+        );
+        CREATE TABLE judges (judge_id INTEGER PRIMARY KEY AUTOINCREMENT, judge_name TEXT UNIQUE);
+        CREATE TABLE cause_list_judges_20260105 (
+            cause_id INTEGER, judge_id INTEGER, PRIMARY KEY (cause_id, judge_id)
+        );
+        INSERT INTO judges (judge_name) VALUES ('HON''BLE MR. JUSTICE A'), ('HON''BLE MR. JUSTICE B');
+        INSERT INTO cause_list_20260105 (sno, case_no, petitioner_respondent, advocate, court_no, page_no)
+        VALUES ('1', 'C.A. No. 7/2020 III', 'Z Versus W', 'PAL [P-1]', '2', '1');
+        INSERT INTO cause_list_judges_20260105 VALUES (1, 1), (1, 2);
+    """)
+    conn.close()
+
+    assert len(repo.find_by_judge(DATE, "HON'BLE MR. JUSTICE B")) == 1
+    assert [r[3] for r in repo.judge_workload(DATE)] == [1, 1]
+    assert repo.advocate_workload(DATE) == [("PAL", "20260105", 1)]
+    assert len(repo.find_cases(DATE, "CA")) == 1
+
+
+def test_reads_tolerate_an_empty_database(repo):
+    assert repo.judge_workload() == []
+    assert repo.find_cases(case_type="CA") == []
+    assert repo.find_by_ia(ia_from=1) == []
+    assert repo.find_by_judge(DATE, "X") == []